@@ -1,8 +1,22 @@
-from climattr import attribution
-from climattr import correction
-from climattr import exploratory
-from climattr import filter
-from climattr import validation
-from climattr import utils
-from climattr import indice
-from climattr import impacts
\ No newline at end of file
+import importlib
+
+# submodules are imported on first access, so importing climattr (and the 
+# CLI parsers) does not load xclim, cartopy or salem until they are needed
+__all__ = [
+    'attribution',
+    'correction',
+    'exploratory',
+    'filter',
+    'validation',
+    'utils',
+    'indice',
+    'impacts',
+]
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'climattr.{name}')
+    raise AttributeError(f"module 'climattr' has no attribute '{name}'")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
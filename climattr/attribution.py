@@ -1,23 +1,37 @@
+import hashlib
+import os
+import threading
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
 import numpy as np
 import pandas as pd
 import xarray as xr
 
-from typing import List
+from matplotlib.collections import LineCollection
+from scipy.special import gamma, ndtr
+from typing import List, Union
 
 from climattr.utils import (
-    find_nearest,
+    find_nearest_sorted,
     get_percentiles_from_ci,
-    get_fitted_percentiles
+    get_fitted_percentiles,
+    sorted_percentiles,
+    _lerp
 )
 from climattr.validator import (
     validate_direction, 
-    validate_ci
+    validate_ci,
+    validate_fit_method,
+    validate_n_jobs
 )
 
 def _calc_bootstrap_ensemble(
     data: np.ndarray, 
     direction: str = "ascending", 
-    boot_size: int = 1000) -> np.ndarray:
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None) -> np.ndarray:
     """
     Generates bootstrap ensembles from the input data and sorts them in the 
     specified direction.
@@ -38,6 +52,10 @@ def _calc_bootstrap_ensemble(
         
     boot_size : int, optional
         The number of bootstrap samples to generate. Default is 1000.
+
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the bootstrap samples. Default is
+        None, which draws fresh entropy from the operating system.
     
     Returns
     -------
@@ -65,9 +83,12 @@ def _calc_bootstrap_ensemble(
     # Flatten the input data
     n_samples = data.shape[0]
     
-    # Generate the bootstrap samples using np.random.choice
-    sample_store = np.random.choice(data, (int(boot_size), n_samples), replace=True)
-    
+    # Generate the bootstrap samples by drawing int32 indices with the 
+    # Generator API and gathering the values
+    rng = np.random.default_rng(rng)
+    idx = rng.integers(0, n_samples, size=(int(boot_size), n_samples), dtype=np.int32)
+    sample_store = data[idx]
+
     # Sort each row in the sample_store
     sample_store.sort(axis=1)
     
@@ -79,11 +100,721 @@ def _calc_bootstrap_ensemble(
 
 ###############################################################################
 
+# number of bootstrap replicates held in memory at once by the batched 
+# samplers, whose results do not depend on it
+_BOOTSTRAP_BATCH_SIZE = 100
+
+def _iter_bootstrap_ensemble(
+    data: np.ndarray, 
+    boot_size: int = 1000,
+    batch_size: int = _BOOTSTRAP_BATCH_SIZE,
+    rng: Union[None, int, np.random.Generator] = None):
+    """
+    Yields the ascending sorted bootstrap ensemble of `_calc_bootstrap_ensemble` 
+    in batches of at most `batch_size` samples.
+
+    The batches are drawn from a single generator, so stacking them gives the 
+    same ensemble as one call to `_calc_bootstrap_ensemble` with the same rng.
+    """
+    rng = np.random.default_rng(rng)
+    for start in range(0, int(boot_size), batch_size):
+        yield _calc_bootstrap_ensemble(
+            data, boot_size=min(batch_size, int(boot_size) - start), rng=rng
+        )
+
+###############################################################################
+
+def _calc_bootstrap_weights(
+    n_samples: int,
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None) -> np.ndarray:
+    """
+    Generates bootstrap resampling weights as multinomial counts.
+
+    Each row holds how many times every original sample is drawn in one
+    bootstrap replicate, which is statistically equivalent to resampling the
+    data with replacement but avoids materializing the resampled values. The 
+    counts are obtained by binning uniform draws of the sample indices, which 
+    follows the same multinomial distribution as `Generator.multinomial` and 
+    is several times faster to generate.
+
+    Parameters
+    ----------
+    n_samples : int
+        The number of samples in the original data.
+
+    boot_size : int, optional
+        The number of bootstrap replicates to generate. Default is 1000.
+
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the weights. Default is None,
+        which draws fresh entropy from the operating system.
+
+    Returns
+    -------
+    numpy.ndarray
+        A 2D integer array of shape (boot_size, n_samples) where each row sums
+        to n_samples.
+    """
+    rng = np.random.default_rng(rng)
+    boot_size = int(boot_size)
+
+    # offset the draws of each replicate so a single bincount fills every row
+    draws = rng.integers(0, n_samples, size=(boot_size, n_samples))
+    draws += np.arange(boot_size)[:, None] * n_samples
+    weights = np.bincount(draws.ravel(), minlength=boot_size * n_samples)
+
+    return weights.reshape(boot_size, n_samples).astype(np.int32)
+
+def _iter_bootstrap_weights(
+    n_samples: int,
+    boot_size: int = 1000,
+    batch_size: int = _BOOTSTRAP_BATCH_SIZE,
+    rng: Union[None, int, np.random.Generator] = None):
+    """
+    Yields the weights of `_calc_bootstrap_weights` in batches of at most 
+    `batch_size` replicates, drawn from a single generator.
+    """
+    rng = np.random.default_rng(rng)
+    for start in range(0, int(boot_size), batch_size):
+        yield _calc_bootstrap_weights(
+            n_samples, min(batch_size, int(boot_size) - start), rng
+        )
+
+###############################################################################
+
+def _fit_weighted_norm(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted maximum likelihood estimate of `scipy.stats.norm`."""
+    # center the data first to avoid cancellation in the variance
+    offset = data.mean()
+    centered = data - offset
+    n = weights.sum(axis=1)
+
+    loc = weights @ centered / n
+    scale = np.sqrt(np.maximum(weights @ centered**2 / n - loc**2, 0))
+
+    return np.column_stack([loc + offset, scale])
+
+def _fit_weighted_expon(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted maximum likelihood estimate of `scipy.stats.expon`."""
+    loc = np.where(weights > 0, data, np.inf).min(axis=1)
+    scale = weights @ data / weights.sum(axis=1) - loc
+
+    return np.column_stack([loc, scale])
+
+def _fit_weighted_uniform(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted maximum likelihood estimate of `scipy.stats.uniform`."""
+    loc = np.where(weights > 0, data, np.inf).min(axis=1)
+    scale = np.where(weights > 0, data, -np.inf).max(axis=1) - loc
+
+    return np.column_stack([loc, scale])
+
+def _fit_weighted_gumbel_r(
+    data: np.ndarray, 
+    weights: np.ndarray,
+    tol: float = 1e-12,
+    max_iter: int = 100) -> np.ndarray:
+    """
+    Weighted maximum likelihood estimate of `scipy.stats.gumbel_r`.
+
+    The scale solves the same likelihood equation as `scipy.stats.gumbel_r.fit`, 
+    with Newton steps applied to every replicate at once, and the location 
+    follows from the scale.
+    """
+    offset = data.mean()
+    centered = data - offset
+    n = weights.sum(axis=1)
+    drawn = weights > 0
+
+    mean = weights @ centered / n
+    # method of moments starting point
+    scale = np.sqrt(6) / np.pi * np.sqrt(
+        np.maximum(weights @ centered**2 / n - mean**2, 0)
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iter):
+            exponent = -centered / scale[:, None]
+            # shift by the largest drawn exponent to avoid overflow
+            shift = np.where(drawn, exponent, -np.inf).max(axis=1)
+            w_exp = weights * np.exp(exponent - shift[:, None])
+
+            s0 = w_exp.sum(axis=1)
+            s1 = w_exp @ centered
+            s2 = w_exp @ centered**2
+
+            # the likelihood equation is strictly decreasing in the scale
+            func = mean - s1 / s0 - scale
+            deriv = -(s2 * s0 - s1**2) / (scale * s0)**2 - 1
+            step = func / deriv
+            new_scale = scale - step
+            scale = np.where(new_scale > 0, new_scale, scale / 2)
+
+            if not np.any(np.abs(step) > tol * scale):
+                break
+
+        # log-sum-exp with the converged scale, as scipy computes the location
+        exponent = -centered / scale[:, None]
+        shift = np.where(drawn, exponent, -np.inf).max(axis=1)
+        s0 = (weights * np.exp(exponent - shift[:, None])).sum(axis=1)
+        loc = offset - scale * (shift + np.log(s0 / n))
+
+    return np.column_stack([loc, scale])
+
+# distributions whose scipy maximum likelihood fit is evaluated for every 
+# replicate at once, in closed form or, for gumbel_r, with vectorized Newton
+# steps
+_WEIGHTED_FITS = {
+    'norm': _fit_weighted_norm,
+    'expon': _fit_weighted_expon,
+    'uniform': _fit_weighted_uniform,
+    'gumbel_r': _fit_weighted_gumbel_r,
+}
+
+def _weighted_lmoments(data: np.ndarray, weights: np.ndarray) -> tuple:
+    """
+    First two sample L-moments and the L-skewness of every replicate described 
+    by weights.
+
+    The replicate sorted samples are the sorted data repeated by their counts, 
+    so the probability weighted moments are sums over the rank ranges covered 
+    by each value, read from prefix sums of the rank weights.
+    """
+    n_samples = data.shape[0]
+    order = np.argsort(data)
+    offset = data.mean()
+    sorted_data = data[order] - offset
+    counts = weights[:, order]
+
+    # prefix sums of the rank weights (j - 1) / (n - 1) and 
+    # (j - 1)(j - 2) / ((n - 1)(n - 2)) of the ranks j = 1..n
+    ranks = np.arange(n_samples, dtype=float)
+    prefix_1 = np.concatenate([[0.], np.cumsum(ranks / (n_samples - 1))])
+    prefix_2 = np.concatenate([[0.], np.cumsum(
+        ranks * (ranks - 1) / ((n_samples - 1) * (n_samples - 2))
+    )])
+
+    last_rank = np.cumsum(counts, axis=1)
+    first_rank = last_rank - counts
+
+    b0 = counts @ sorted_data / n_samples
+    b1 = ((prefix_1[last_rank] - prefix_1[first_rank]) @ sorted_data) / n_samples
+    b2 = ((prefix_2[last_rank] - prefix_2[first_rank]) @ sorted_data) / n_samples
+
+    l1 = b0 + offset
+    l2 = 2 * b1 - b0
+    l3 = 6 * b2 - 6 * b1 + b0
+
+    return l1, l2, l3 / l2
+
+def _fit_lmoments_gumbel_r(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted method of L-moments estimate of `scipy.stats.gumbel_r`."""
+    l1, l2, _ = _weighted_lmoments(data, weights)
+    scale = l2 / np.log(2)
+    loc = l1 - np.euler_gamma * scale
+
+    return np.column_stack([loc, scale])
+
+def _fit_lmoments_genextreme(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Weighted method of L-moments estimate of `scipy.stats.genextreme`, using the 
+    shape approximation of Hosking et al. (1985). The shape follows the scipy 
+    sign convention, which matches Hosking's k.
+    """
+    l1, l2, t3 = _weighted_lmoments(data, weights)
+    z = 2 / (3 + t3) - np.log(2) / np.log(3)
+    c = 7.8590 * z + 2.9554 * z**2
+
+    gamma_c = gamma(1 + c)
+    # the Gumbel limit of the estimators when the shape vanishes
+    gumbel = np.abs(c) < 1e-8
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.where(
+            gumbel, l2 / np.log(2), l2 * c / ((1 - 2**-c) * gamma_c)
+        )
+        loc = np.where(
+            gumbel, l1 - np.euler_gamma * scale, l1 - scale * (1 - gamma_c) / c
+        )
+
+    return np.column_stack([c, loc, scale])
+
+# distributions with a method of L-moments estimator
+_LMOMENT_FITS = {
+    'genextreme': _fit_lmoments_genextreme,
+    'gumbel_r': _fit_lmoments_gumbel_r,
+}
+
+###############################################################################
+
+def _fit_replicates(
+    data: np.ndarray,
+    weights: np.ndarray,
+    fit_function) -> np.ndarray:
+    """Fits `fit_function` to each resampled replicate described by weights."""
+    return np.array([
+        fit_function.fit(np.repeat(data, row)) for row in weights
+    ])
+
+###############################################################################
+
+def _fit_weighted(
+    data: np.ndarray,
+    weights: np.ndarray,
+    fit_function,
+    n_jobs: int = 1,
+    fit_method: str = 'mle') -> np.ndarray:
+    """
+    Fits the distribution to every bootstrap replicate described by weights.
+
+    For distributions with a closed form maximum likelihood estimator the
+    parameters of all replicates are computed at once with weighted reductions.
+    Other distributions fall back to calling `fit_function.fit` on each
+    resampled replicate, optionally spread over several processes.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        An array of shape (n_samples,) containing the original data.
+
+    weights : numpy.ndarray
+        An array of shape (boot_size, n_samples) with the number of times each
+        sample is drawn in every replicate.
+
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    n_jobs : int, optional
+        The number of processes used by the per replicate fallback. -1 uses 
+        every available core. Default is 1.
+
+    fit_method : str, optional
+        The estimator, either 'mle' for maximum likelihood or 'lmoments' for 
+        the method of L-moments. Default is 'mle'.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (boot_size, n_params) with the fitted parameters of
+        each replicate, in the same order returned by `fit_function.fit`.
+    """
+    fit_name = getattr(fit_function, 'name', None)
+    if fit_method == 'lmoments':
+        if fit_name not in _LMOMENT_FITS:
+            raise ValueError(
+                "fit_method 'lmoments' is only available for "
+                f"{', '.join(_LMOMENT_FITS)}."
+            )
+        return _LMOMENT_FITS[fit_name](data, weights)
+
+    if fit_name in _WEIGHTED_FITS:
+        return _WEIGHTED_FITS[fit_name](data, weights)
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, weights.shape[0])
+
+    if n_jobs <= 1:
+        return _fit_replicates(data, weights, fit_function)
+
+    # the weights are drawn before dispatching, so the result does not depend 
+    # on the number of jobs
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        params = executor.map(
+            _fit_replicates, 
+            repeat(data), 
+            np.array_split(weights, n_jobs), 
+            repeat(fit_function)
+        )
+        return np.concatenate(list(params))
+
+###############################################################################
+
+def _fit_bootstrap(
+    data: np.ndarray,
+    fit_function,
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None,
+    n_jobs: int = 1,
+    fit_method: str = 'mle') -> np.ndarray:
+    """
+    Fits the distribution to `boot_size` bootstrap replicates of the data.
+
+    Distributions with a closed form weighted fit, and every L-moments fit, 
+    are fitted batch by batch, so only one batch of weights is held in memory 
+    at a time.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        An array of shape (n_samples,) containing the original data.
+
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    boot_size : int, optional
+        The number of bootstrap replicates to fit. Default is 1000.
+
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the replicates. Default is None.
+
+    n_jobs : int, optional
+        The number of processes used by the per replicate fallback of 
+        `_fit_weighted`. Default is 1.
+
+    fit_method : str, optional
+        The estimator passed to `_fit_weighted`. Default is 'mle'.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (boot_size, n_params) with the fitted parameters of
+        each replicate.
+    """
+    n_samples = data.shape[0]
+
+    vectorized = fit_method == 'lmoments' or (
+        getattr(fit_function, 'name', None) in _WEIGHTED_FITS
+    )
+    if not vectorized:
+        # the per replicate fits dominate here, so draw every replicate at 
+        # once and let _fit_weighted spread them over the processes
+        weights = _calc_bootstrap_weights(n_samples, boot_size, rng)
+        return _fit_weighted(data, weights, fit_function, n_jobs)
+
+    return np.concatenate([
+        _fit_weighted(data, weights, fit_function, fit_method=fit_method)
+        for weights in _iter_bootstrap_weights(n_samples, boot_size, rng=rng)
+    ])
+
+###############################################################################
+
+# maximum likelihood fits of the original data, keyed by fit_function and the
+# array contents, shared by repeated plot and metric calls on the same data
+_FIT_CACHE_SIZE = 32
+_fit_cache = {}
+_fit_cache_lock = threading.Lock()
+
+def _fit_cached(data: np.ndarray, fit_function) -> tuple:
+    """
+    Fits the distribution to the data, reusing a previous fit of the same data.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        An array of shape (n_samples,) containing the data to fit.
+
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    Returns
+    -------
+    tuple
+        The fitted parameters, in the same order returned by `fit_function.fit`.
+    """
+    data = np.ascontiguousarray(data)
+    key = (
+        fit_function, data.dtype.str, data.shape, 
+        hashlib.sha1(data.view(np.uint8)).hexdigest()
+    )
+
+    with _fit_cache_lock:
+        params = _fit_cache.get(key)
+    if params is not None:
+        return params
+
+    params = tuple(fit_function.fit(data))
+    with _fit_cache_lock:
+        # evict the oldest entry, dicts keep insertion order
+        if len(_fit_cache) >= _FIT_CACHE_SIZE:
+            del _fit_cache[next(iter(_fit_cache))]
+        _fit_cache[key] = params
+
+    return params
+
+###############################################################################
+
+def _norm_cdf(x, loc, scale):
+    """Closed form cdf of `scipy.stats.norm`."""
+    return np.where(scale > 0, ndtr((x - loc) / scale), np.nan)
+
+def _norm_sf(x, loc, scale):
+    """Closed form sf of `scipy.stats.norm`."""
+    return np.where(scale > 0, ndtr((loc - x) / scale), np.nan)
+
+def _gumbel_r_cdf(x, loc, scale):
+    """Closed form cdf of `scipy.stats.gumbel_r`."""
+    return np.where(scale > 0, np.exp(-np.exp(-(x - loc) / scale)), np.nan)
+
+def _gumbel_r_sf(x, loc, scale):
+    """Closed form sf of `scipy.stats.gumbel_r`."""
+    return np.where(scale > 0, -np.expm1(-np.exp(-(x - loc) / scale)), np.nan)
+
+def _expon_cdf(x, loc, scale):
+    """Closed form cdf of `scipy.stats.expon`."""
+    z = np.maximum((x - loc) / scale, 0.)
+    return np.where(scale > 0, -np.expm1(-z), np.nan)
+
+def _expon_sf(x, loc, scale):
+    """Closed form sf of `scipy.stats.expon`."""
+    z = np.maximum((x - loc) / scale, 0.)
+    return np.where(scale > 0, np.exp(-z), np.nan)
+
+def _uniform_cdf(x, loc, scale):
+    """Closed form cdf of `scipy.stats.uniform`."""
+    return np.where(scale > 0, np.clip((x - loc) / scale, 0., 1.), np.nan)
+
+def _uniform_sf(x, loc, scale):
+    """Closed form sf of `scipy.stats.uniform`."""
+    return np.where(scale > 0, np.clip((loc + scale - x) / scale, 0., 1.), np.nan)
+
+def _genextreme_reduced(x, c, loc, scale):
+    """
+    Returns `-log(-log(cdf))` of `scipy.stats.genextreme`, i.e. the reduced 
+    variate of the equivalent Gumbel distribution. Values beyond the upper 
+    (c > 0) or lower (c < 0) end of the support map to +inf and -inf.
+    """
+    z = (x - loc) / scale
+    cz = c * z
+    # log1p(-1) = -inf puts points outside the support on the right side 
+    # once divided by the sign of c
+    log_term = -np.log1p(-np.minimum(cz, 1.)) / np.where(c == 0, 1., c)
+    return np.where(c == 0, z, log_term)
+
+def _genextreme_cdf(x, c, loc, scale):
+    """Closed form cdf of `scipy.stats.genextreme`."""
+    t = _genextreme_reduced(x, c, loc, scale)
+    return np.where(scale > 0, np.exp(-np.exp(-t)), np.nan)
+
+def _genextreme_sf(x, c, loc, scale):
+    """Closed form sf of `scipy.stats.genextreme`."""
+    t = _genextreme_reduced(x, c, loc, scale)
+    return np.where(scale > 0, -np.expm1(-np.exp(-t)), np.nan)
+
+# (cdf, sf) of distributions evaluated without the rv_continuous dispatch
+_CLOSED_FORMS = {
+    'norm': (_norm_cdf, _norm_sf),
+    'gumbel_r': (_gumbel_r_cdf, _gumbel_r_sf),
+    'genextreme': (_genextreme_cdf, _genextreme_sf),
+    'expon': (_expon_cdf, _expon_sf),
+    'uniform': (_uniform_cdf, _uniform_sf),
+}
+
+def _norm_pdf(x, loc, scale):
+    """Closed form pdf of `scipy.stats.norm`."""
+    z = (x - loc) / scale
+    return np.where(scale > 0, np.exp(-z**2 / 2) / (np.sqrt(2 * np.pi) * scale), np.nan)
+
+def _gumbel_r_pdf(x, loc, scale):
+    """Closed form pdf of `scipy.stats.gumbel_r`."""
+    z = (x - loc) / scale
+    return np.where(scale > 0, np.exp(-z - np.exp(-z)) / scale, np.nan)
+
+def _genextreme_pdf(x, c, loc, scale):
+    """Closed form pdf of `scipy.stats.genextreme`."""
+    t = _genextreme_reduced(x, c, loc, scale)
+    # the density vanishes beyond both ends of the support
+    pdf = np.where(np.isfinite(t), np.exp(-(1 - c) * t - np.exp(-t)) / scale, 0.)
+    return np.where(scale > 0, pdf, np.nan)
+
+def _expon_pdf(x, loc, scale):
+    """Closed form pdf of `scipy.stats.expon`."""
+    z = (x - loc) / scale
+    return np.where(scale > 0, np.where(z >= 0, np.exp(-z) / scale, 0.), np.nan)
+
+def _uniform_pdf(x, loc, scale):
+    """Closed form pdf of `scipy.stats.uniform`."""
+    inside = (x >= loc) & (x <= loc + scale)
+    return np.where(scale > 0, np.where(inside, 1 / scale, 0.), np.nan)
+
+_CLOSED_FORM_PDFS = {
+    'norm': _norm_pdf,
+    'gumbel_r': _gumbel_r_pdf,
+    'genextreme': _genextreme_pdf,
+    'expon': _expon_pdf,
+    'uniform': _uniform_pdf,
+}
+
+###############################################################################
+
+def _probability_density(fit_function, x: np.ndarray, params) -> np.ndarray:
+    """
+    Evaluates the probability density of the fitted distribution at x, using a 
+    closed form when one is available.
+
+    Parameters
+    ----------
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    x : numpy.ndarray
+        The points where the density is evaluated.
+
+    params : tuple
+        The fitted parameters, in the order returned by `fit_function.fit`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The probability density at every point of x.
+    """
+    fit_name = getattr(fit_function, 'name', None)
+    if fit_name in _CLOSED_FORM_PDFS:
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return _CLOSED_FORM_PDFS[fit_name](x, *params)
+
+    return fit_function.pdf(x, *params)
+
+###############################################################################
+
+def _exceedance_probability(
+    fit_function,
+    thresh: float,
+    params: np.ndarray,
+    direction: str = 'descending') -> np.ndarray:
+    """
+    Evaluates the probability of exceeding the threshold for a set of fitted
+    parameters.
+
+    Parameters
+    ----------
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    thresh : float
+        The threshold value for which the probability will be calculated.
+
+    params : numpy.ndarray
+        An array of shape (boot_size, n_params) with the fitted parameters, or
+        of shape (n_params,) for a single fit.
+
+    direction : str, optional
+        The direction in which to assess exceedance of the threshold. Default is
+        "descending", which uses the survival function.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (boot_size,) with the exceedance probabilities, or a
+        scalar for a single fit.
+    """
+    params = np.asarray(params)
+
+    # skip the generic scipy machinery for distributions with a closed form
+    fit_name = getattr(fit_function, 'name', None)
+    if fit_name in _CLOSED_FORMS:
+        cdf, sf = _CLOSED_FORMS[fit_name]
+        # degenerate fits with a zero scale are masked to nan, as in scipy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if direction == 'descending':
+                return sf(thresh, *params.T)
+            return cdf(thresh, *params.T)
+
+    if direction == 'descending':
+        return fit_function.sf(thresh, *params.T)
+
+    return fit_function.cdf(thresh, *params.T)
+
+###############################################################################
+
+def _return_period(
+    fit_function,
+    data: np.ndarray,
+    params: np.ndarray,
+    direction: str = 'descending') -> np.ndarray:
+    """
+    Evaluates the return period of every value in data for a fitted 
+    distribution.
+
+    Values beyond a bounded end of the support (uniform, expon or genextreme 
+    with c > 0) have a zero exceedance probability and give an infinite 
+    return period, which matplotlib leaves out of plots and autoscaling.
+
+    Parameters
+    ----------
+    fit_function : callable
+        A statistical distribution used to model the data.
+
+    data : numpy.ndarray
+        An array with the values for which the return period is calculated.
+
+    params : numpy.ndarray
+        The fitted parameters of the distribution.
+
+    direction : str, optional
+        The direction in which to assess exceedance of the values. Default is
+        "descending", which uses the survival function.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array with the same shape as data containing the return periods.
+    """
+    prob = _exceedance_probability(fit_function, data, params, direction)
+
+    with np.errstate(divide='ignore'):
+        return 1 / prob
+
+###############################################################################
+
+class _EnsembleTails:
+    """
+    Order statistics across the samples of a (boot_size, n_samples) ensemble 
+    that is fed in batches, keeping only the ranks needed by `percentiles`.
+
+    For confidence intervals these are the lowest and highest few ranks, so 
+    the memory used does not grow with boot_size. The percentiles agree with 
+    `np.percentile(ensemble, percentiles, axis=0)` up to floating point 
+    rounding.
+    """
+
+    def __init__(self, percentiles: List[float], boot_size: int):
+        self.boot_size = int(boot_size)
+
+        virtual_idx = np.asarray(percentiles, dtype=float) / 100 * (self.boot_size - 1)
+        self.prev_idx = np.floor(virtual_idx).astype(np.intp)
+        self.next_idx = np.minimum(self.prev_idx + 1, self.boot_size - 1)
+        self.gamma = (virtual_idx - self.prev_idx)[:, None]
+
+        ranks = np.union1d(self.prev_idx, self.next_idx)
+        low = ranks[ranks < self.boot_size / 2]
+        high = ranks[ranks >= self.boot_size / 2]
+        self.n_low = int(low.max()) + 1 if low.size else 0
+        self.n_high = self.boot_size - int(high.min()) if high.size else 0
+
+        self.tails = None
+        self.has_nan = False
+
+    def update(self, batch: np.ndarray) -> None:
+        """Merges a (batch_size, n_samples) batch of samples into the tails."""
+        self.has_nan = self.has_nan | np.isnan(batch).any(axis=0)
+        if self.tails is not None:
+            batch = np.concatenate([self.tails, batch])
+        batch = np.sort(batch, axis=0)
+
+        if batch.shape[0] > self.n_low + self.n_high:
+            batch = np.concatenate([
+                batch[:self.n_low], batch[batch.shape[0] - self.n_high:]
+            ])
+        self.tails = batch
+
+    def percentiles(self) -> np.ndarray:
+        """Returns the (n_percentiles, n_samples) percentiles of the ensemble."""
+        # ranks above the low tail are counted from the end of the ensemble
+        offset = self.boot_size - self.tails.shape[0]
+        prev_row = np.where(self.prev_idx < self.n_low, self.prev_idx, self.prev_idx - offset)
+        next_row = np.where(self.next_idx < self.n_low, self.next_idx, self.next_idx - offset)
+
+        result = _lerp(self.tails[prev_row], self.tails[next_row], self.gamma)
+        return np.where(self.has_nan, np.nan, result)
+
+###############################################################################
+
 def _calc_return_time_confidence(
     data: np.ndarray, 
     direction: str = "ascending", 
     bootstrap_ci: int = 95, 
-    boot_size: int = 100) -> np.ndarray:
+    boot_size: int = 100,
+    rng: Union[None, int, np.random.Generator] = None) -> np.ndarray:
     """
     Calculates the confidence intervals for the return time of a dataset using 
     bootstrapping.
@@ -109,6 +840,10 @@ def _calc_return_time_confidence(
     boot_size : int, optional
         The number of bootstrap samples to generate. Default is 100.
 
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the bootstrap samples. Default is 
+        None.
+
     Returns
     -------
     numpy.ndarray
@@ -136,18 +871,185 @@ def _calc_return_time_confidence(
     """
     ci_inf, ci_sup = get_percentiles_from_ci(bootstrap_ci)
 
-    sample_store = _calc_bootstrap_ensemble(
-        data, 
-        direction=direction, 
-        boot_size=boot_size
-    )
-    # Calculate the confidence intervals using np.percentile
-    conf_inter = np.percentile(sample_store, np.array([ci_inf, ci_sup]), axis=0)
-    
+    # Draw the ascending sorted samples in batches and keep only the order 
+    # statistics needed by the confidence interval of every rank
+    tails = _EnsembleTails([ci_inf, ci_sup], boot_size)
+    for batch in _iter_bootstrap_ensemble(data, boot_size=boot_size, rng=rng):
+        tails.update(batch)
+    conf_inter = tails.percentiles()
+
+    # The descending order statistics are the ascending ones reversed
+    if direction == "descending":
+        conf_inter = conf_inter[:, ::-1]
+
     return conf_inter
 
 ###############################################################################
 
+def _rp_plot_compute(
+    data: np.ndarray,
+    fit_function,
+    direction: str = 'descending',
+    bootstrap_ci: int = 95,
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None) -> dict:
+    """
+    Calculates the return period data plotted by `_rp_plot_data`.
+
+    This function holds the numerical part of the return period plot (fit, 
+    bootstrap and confidence intervals) and does not touch any matplotlib 
+    object, so it can safely run in a worker thread.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        An array of shape (n_samples,) containing the input data for which return 
+        periods and confidence intervals will be calculated.
+        
+    fit_function : callable
+        A function that fits the input data to a distribution and calculates the 
+        return period.
+        
+    direction : str, optional
+        The direction in which to sort the bootstrap samples. Can be either 
+        "ascending" or "descending" (default).
+        
+    bootstrap_ci : int, optional
+        The confidence interval percentage to use for calculating the return time 
+        confidence intervals. Default is 95.
+        
+    boot_size : int, optional
+        The number of bootstrap samples to generate. Default is 1000.
+
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the bootstrap samples. Default is 
+        None.
+
+    Returns
+    -------
+    dict
+        A dictionary with the sample return periods ('return_period'), the data 
+        and return period confidence intervals ('conf_data' and 'conf_rp') and 
+        the fitted curve ('fitted_x' and 'fitted_rp').
+    """
+    params = _fit_cached(data, fit_function)
+    return_period = _return_period(fit_function, data, params, direction)
+
+    # share every batch of the sorted bootstrap ensemble between both 
+    # confidence intervals, so the full ensemble is never held in memory
+    ci_inf, ci_sup = get_percentiles_from_ci(bootstrap_ci)
+    tails_data = _EnsembleTails([ci_inf, ci_sup], boot_size)
+    tails_rp = _EnsembleTails([ci_inf, ci_sup], boot_size)
+
+    for sample_store in _iter_bootstrap_ensemble(data, boot_size=boot_size, rng=rng):
+        tails_data.update(sample_store)
+        # the return period is a monotonic transform of the data, so 
+        # transforming the sorted samples keeps every row sorted
+        tails_rp.update(_return_period(fit_function, sample_store, params, direction))
+
+    # the ranks follow the ascending samples, flip them to the order of data
+    conf_data = tails_data.percentiles()
+    conf_rp = tails_rp.percentiles()
+    if direction == 'descending':
+        conf_data = conf_data[:, ::-1]
+        conf_rp = conf_rp[:, ::-1]
+
+    # fitted line
+    x = np.linspace(
+        fit_function.ppf(0.001, *params), 
+        fit_function.ppf(0.991, *params), 
+        700
+    )
+    fitted_rp = _return_period(fit_function, x, params, direction)
+
+    return {
+        'return_period': return_period,
+        'conf_data': conf_data,
+        'conf_rp': conf_rp,
+        'fitted_x': x,
+        'fitted_rp': fitted_rp
+    }
+
+###############################################################################
+
+def _rp_plot_draw(
+    data: np.ndarray,
+    rp_data: dict,
+    color: str,
+    label: str,
+    ax) -> List[np.ndarray]:
+    """
+    Draws the output of `_rp_plot_compute` on a given axis.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        An array of shape (n_samples,) containing the input data.
+        
+    rp_data : dict
+        The dictionary returned by `_rp_plot_compute` for `data`.
+        
+    color : str
+        The color to use for plotting the return periods and confidence intervals.
+        
+    label : str
+        The label to use for the plot legend.
+        
+    ax : matplotlib.axes.Axes
+        The matplotlib axes object on which to plot the data.
+
+    Returns
+    -------
+    List[np.ndarray]
+        A list of two arrays containing the lower and upper bounds of the confidence 
+        intervals for each sample.
+    """
+    return_period = rp_data['return_period']
+    conf_data_inf, conf_data_sup = rp_data['conf_data']
+    conf_rp_inf, conf_rp_sup = rp_data['conf_rp']
+
+    ax.semilogx(
+        return_period, data, marker='o', markersize=2,
+        linestyle='None', mec=color, mfc=color,
+        color=color, fillstyle='full',
+        label=label, zorder=2
+    )
+
+    # plot the fitted line
+    ax.semilogx(rp_data['fitted_rp'], rp_data['fitted_x'], color=color, lw=2)
+
+    ax.fill_between(
+        return_period, conf_data_inf, conf_data_sup, color=color,
+        alpha=0.2,linewidth=1.,zorder=0
+    )
+
+    # draw the confidence interval segments of every sample as a single
+    # collection of shape (n_samples, 2, 2) instead of one line per sample
+    segments = np.concatenate([
+        np.stack([
+            np.column_stack([return_period, conf_data_inf]),
+            np.column_stack([return_period, conf_data_sup])
+        ], axis=1),
+        np.stack([
+            np.column_stack([conf_rp_inf, data]),
+            np.column_stack([conf_rp_sup, data])
+        ], axis=1)
+    ])
+    ax.add_collection(
+        LineCollection(segments, colors=color, linewidths=1., zorder=1), 
+        autolim=False
+    )
+    # collections do not autoscale correctly on log axes, so register the
+    # segment ends with the data limits explicitly. Infinite return periods
+    # are not drawn and would stretch the axis, so they are left out
+    points = segments.reshape(-1, 2)
+    ax.update_datalim(points[np.isfinite(points).all(axis=1)])
+    ax.autoscale_view()
+
+    return conf_rp_inf, conf_rp_sup
+
+###############################################################################
+
 def _rp_plot_data(
     data: np.ndarray,
     fit_function,
@@ -156,7 +1058,8 @@ def _rp_plot_data(
     ax,
     direction: str = 'descending',
     bootstrap_ci: int = 95,
-    boot_size: int = 1000) -> List[np.ndarray]:
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None) -> List[np.ndarray]:
     """
     Plots return period data along with its confidence intervals on a given axis.
 
@@ -194,72 +1097,25 @@ def _rp_plot_data(
     boot_size : int, optional
         The number of bootstrap samples to generate. Default is 1000.
 
+    rng : None, int or numpy.random.Generator, optional
+        Seed or random generator used to draw the bootstrap samples. Default is 
+        None.
+
     Returns
     -------
     List[np.ndarray]
         A list of two arrays containing the lower and upper bounds of the confidence 
         intervals for each sample.
     """
-    return_period = np.array([
-        _rp_calculation(data, fit_function, i, direction) for i in data]
-    )
-
-    conf_data = _calc_return_time_confidence(
+    rp_data = _rp_plot_compute(
         data, 
+        fit_function, 
         direction=direction, 
-        boot_size=boot_size, 
-        bootstrap_ci=bootstrap_ci
-    )
-    conf_rp = _calc_return_time_confidence(
-        return_period,
-        direction='descending',
+        bootstrap_ci=bootstrap_ci,
         boot_size=boot_size,
-        bootstrap_ci=bootstrap_ci
+        rng=rng
     )
-
-    ax.semilogx(
-        return_period, data, marker='o', markersize=2,
-        linestyle='None', mec=color, mfc=color,
-        color=color, fillstyle='full',
-        label=label, zorder=2
-    )
-
-    # plot the fitted line
-    params = fit_function.fit(data)
-    x = np.linspace(
-        fit_function.ppf(0.001, *params), 
-        fit_function.ppf(0.991, *params), 
-        700
-    )
-    if direction == 'descending':
-        fitted_rp = np.array([1 / fit_function.sf(i, *params) for i in x])
-    else:
-        fitted_rp = np.array([1 / fit_function.cdf(i, *params) for i in x])
-
-    ax.semilogx(fitted_rp, x, color=color, lw=2)
-
-    conf_data_inf = conf_data[0,:].squeeze()
-    conf_data_sup = conf_data[1,:].squeeze()
-
-    conf_rp_inf = conf_rp[0,:].squeeze()
-    conf_rp_sup = conf_rp[1,:].squeeze()
-
-    ax.fill_between(
-        return_period, conf_data_inf, conf_data_sup, color=color,
-        alpha=0.2,linewidth=1.,zorder=0
-    )
-    ax.semilogx(
-        [return_period, return_period],
-        [conf_data_inf, conf_data_sup],
-        color=color, linewidth=1., zorder=1
-    )
-    ax.semilogx(
-        [conf_rp_inf, conf_rp_sup],
-        [data, data],
-        color=color, linewidth=1., zorder=1
-    )
-
-    return conf_rp_inf, conf_rp_sup
+    return _rp_plot_draw(data, rp_data, color, label, ax)
 
 ###############################################################################
 
@@ -298,15 +1154,11 @@ def _pr_calculation(
     float
         The calculated probability ratio.
     """
-    params_all = fit_function.fit(all_array)
-    params_nat = fit_function.fit(nat_array)
+    params_all = _fit_cached(all_array, fit_function)
+    params_nat = _fit_cached(nat_array, fit_function)
 
-    if direction == 'descending':
-        pr = fit_function.sf(thresh, *params_all) \
-            / fit_function.sf(thresh, *params_nat)
-    else:
-        pr = fit_function.cdf(thresh, *params_all) \
-            / fit_function.cdf(thresh, *params_nat)
+    pr = _exceedance_probability(fit_function, thresh, params_all, direction) \
+        / _exceedance_probability(fit_function, thresh, params_nat, direction)
 
     return pr
 
@@ -384,14 +1236,9 @@ def _rp_calculation(
         The calculated return period for the given threshold.
     """
 
-    params = fit_function.fit(data)
-
-    if direction == 'descending':
-        rp = 1 / fit_function.sf(thresh, *params)
-    else:
-        rp = 1 / fit_function.cdf(thresh, *params)
+    params = _fit_cached(data, fit_function)
 
-    return rp
+    return _return_period(fit_function, thresh, params, direction)
 
 ###############################################################################
 
@@ -402,7 +1249,10 @@ def attribution_metrics(
     thresh: float,
     direction: str = 'descending',
     bootstrap_ci: int = 95,
-    boot_size: int = 1000) -> pd.DataFrame:
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None,
+    n_jobs: int = 1,
+    fit_method: str = 'mle') -> pd.DataFrame:
     """
     Calculate attribution metrics including Probability Ratio (PR), 
     Fraction of Attributable Risk (FAR), and Return Periods (RP) for 
@@ -437,6 +1287,20 @@ def attribution_metrics(
     boot_size : int, optional, default = 1000
         The number of bootstrap samples to generate.
 
+    rng : None, int or numpy.random.Generator, optional, default = None
+        Seed or random generator used to draw the bootstrap samples. Pass a 
+        fixed seed to get reproducible confidence intervals.
+
+    n_jobs : int, optional, default = 1
+        The number of processes used to fit the bootstrap samples of 
+        distributions without a closed form fit. -1 uses every available core.
+
+    fit_method : str, optional, default = 'mle'
+        The estimator fitted to every bootstrap sample. 'mle' uses maximum 
+        likelihood, as `fit_function.fit`. 'lmoments' uses the method of 
+        L-moments, which is much faster and more robust on short samples, and 
+        is available for `scipy.stats.genextreme` and `scipy.stats.gumbel_r`.
+
     Returns
     -------
     pd.DataFrame
@@ -444,53 +1308,46 @@ def attribution_metrics(
         along with their confidence intervals (CI).
     """
     validate_direction(direction)
+    validate_n_jobs(n_jobs)
+    validate_fit_method(fit_method)
 
-    all_array = all.to_numpy().flatten()
-    nat_array = nat.to_numpy().flatten()
+    all_array = all.to_numpy().ravel()
+    nat_array = nat.to_numpy().ravel()
 
-    all_boot = _calc_bootstrap_ensemble(all_array, boot_size=boot_size)    
-    nat_boot = _calc_bootstrap_ensemble(nat_array, boot_size=boot_size)
+    # fit the bootstrap replicates of ALL first and NAT second from one 
+    # generator, so a seed always gives the same replicates
+    rng = np.random.default_rng(rng)
+    params_all = _fit_bootstrap(
+        all_array, fit_function, boot_size, rng, n_jobs, fit_method
+    )
+    params_nat = _fit_bootstrap(
+        nat_array, fit_function, boot_size, rng, n_jobs, fit_method
+    )
 
-    template_array = np.zeros(boot_size)
-    metrics = {
-        'PR': template_array.copy(), 
-        'FAR': template_array.copy(), 
-        'RP_ALL': template_array.copy(), 
-        'RP_NAT': template_array.copy()
-    }
-    for boot in range(int(boot_size)):
-        metrics['PR'][boot] = \
-            _pr_calculation(
-                all_boot[boot], nat_boot[boot], fit_function, thresh, direction
-            )
-        metrics['FAR'][boot] = \
-            _far_calculation(
-                all_boot[boot], nat_boot[boot], fit_function, thresh
-            )
-        metrics['RP_ALL'][boot] = \
-            _rp_calculation(
-                all_boot[boot], fit_function, thresh, direction
-            )
-        metrics['RP_NAT'][boot] = \
-            _rp_calculation(
-                nat_boot[boot], fit_function, thresh, direction
-            )
+    prob_all = _exceedance_probability(fit_function, thresh, params_all, direction)
+    prob_nat = _exceedance_probability(fit_function, thresh, params_nat, direction)
+
+    # a replicate with a zero exceedance probability gives an infinite 
+    # return period (and PR), as in `_return_period`
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics = np.stack([
+            prob_all / prob_nat,
+            1 - prob_nat / prob_all,
+            1 / prob_all,
+            1 / prob_nat
+        ])
 
     ci_inf, ci_sup = get_percentiles_from_ci(bootstrap_ci)
 
-    # create empty metrics dataframe
+    # sort every metric once and read the median and confidence interval 
+    # directly from the order statistics
+    metrics.sort(axis=1)
     metrics_result = pd.DataFrame(
-        np.zeros((4, 3)), 
-        columns=['value', 'ci_inf', 'ci_sup'], 
+        sorted_percentiles(metrics, [50, ci_inf, ci_sup]).T,
+        columns=['value', 'ci_inf', 'ci_sup'],
         index=['PR', 'FAR', 'RP_ALL', 'RP_NAT']
     )
 
-    # fill dataframe with metrics
-    for metric_name in ['PR', 'FAR', 'RP_ALL', 'RP_NAT']:
-        metrics_result.loc[metric_name, 'value'] = np.median(metrics[metric_name])
-        metrics_result.loc[metric_name, 'ci_inf'] = np.percentile(metrics[metric_name], ci_inf)
-        metrics_result.loc[metric_name, 'ci_sup'] = np.percentile(metrics[metric_name], ci_sup)
-
     return metrics_result
         
 ###############################################################################
@@ -530,22 +1387,26 @@ def histogram_plot(
         This function does not return anything; it modifies the provided 
         axes object in-place.
     """
-    all_array = all.to_numpy().flatten()
-    nat_array = nat.to_numpy().flatten()
+    all_array = all.to_numpy().ravel()
+    nat_array = nat.to_numpy().ravel()
 
-    params_all = fit_function.fit(all_array)
-    params_nat = fit_function.fit(nat_array)
+    params_all = _fit_cached(all_array, fit_function)
+    params_nat = _fit_cached(nat_array, fit_function)
 
-    ax.hist(all_array, color='C0', alpha=0.5, density=True, label='ALL')
-    ax.hist(nat_array, color='C1', alpha=0.5, density=True, label='NAT')
+    # bin both scenarios on the same edges so the histograms are comparable
+    bins = np.histogram_bin_edges(np.concatenate([all_array, nat_array]))
+    ax.hist(all_array, bins=bins, color='C0', alpha=0.5, density=True, label='ALL')
+    ax.hist(nat_array, bins=bins, color='C1', alpha=0.5, density=True, label='NAT')
 
     # fit the requested distribution and plot it as a line
     percentiles = np.linspace(0.01, 99.9, 700)
     x_all = get_fitted_percentiles(percentiles, params_all, fit_function)
     x_nat = get_fitted_percentiles(percentiles, params_nat, fit_function)
 
-    ax.plot(x_all, fit_function.pdf(x_all, *params_all), color='C0', lw=2)
-    ax.plot(x_nat, fit_function.pdf(x_nat, *params_nat), color='C1', lw=2)
+    pdf_all = _probability_density(fit_function, x_all, params_all)
+    pdf_nat = _probability_density(fit_function, x_nat, params_nat)
+    ax.plot(x_all, pdf_all, color='C0', lw=2)
+    ax.plot(x_nat, pdf_nat, color='C1', lw=2)
 
     ax.axvline(thresh, color='k', ls='--')
     ax.legend()
@@ -560,7 +1421,8 @@ def rp_plot(
     thresh: float,
     direction: str = 'descending',
     bootstrap_ci: int = 95,
-    boot_size: int = 1000) -> None:
+    boot_size: int = 1000,
+    rng: Union[None, int, np.random.Generator] = None) -> None:
     """
     Plot return periods for the "ALL" and "NAT" scenarios, including 
     confidence intervals (CI) for the bootstrapped return periods.
@@ -594,6 +1456,10 @@ def rp_plot(
     boot_size : int, optional, default = 1000
         The number of bootstrap samples to generate.
 
+    rng : None, int or numpy.random.Generator, optional, default = None
+        Seed or random generator used to draw the bootstrap samples. Pass a 
+        fixed seed to get reproducible confidence intervals.
+
     Returns
     -------
     None
@@ -604,24 +1470,39 @@ def rp_plot(
     validate_direction(direction)
     validate_ci(bootstrap_ci)
 
-    all_array = np.sort(all.to_numpy().flatten())
-    nat_array = np.sort(nat.to_numpy().flatten())
+    all_array = np.sort(all.to_numpy().ravel())
+    nat_array = np.sort(nat.to_numpy().ravel())
 
     if direction == 'descending':
         all_array = all_array[::-1]
         nat_array = nat_array[::-1]
 
-    conf_rp_inf_all, conf_rp_sup_all = _rp_plot_data(
-        all_array, fit_function, 'C0', 'ALL', ax, direction, bootstrap_ci, boot_size
+    # independent streams, so the result does not depend on thread scheduling
+    rng_all, rng_nat = np.random.default_rng(rng).spawn(2)
+
+    # the ALL and NAT computations are independent, so run them concurrently 
+    # and keep every matplotlib call on the calling thread
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                _rp_plot_compute, array, fit_function, direction, 
+                bootstrap_ci, boot_size, array_rng
+            )
+            for array, array_rng in ((all_array, rng_all), (nat_array, rng_nat))
+        ]
+        rp_data_all, rp_data_nat = [future.result() for future in futures]
+
+    conf_rp_inf_all, conf_rp_sup_all = _rp_plot_draw(
+        all_array, rp_data_all, 'C0', 'ALL', ax
     )
-    conf_rp_inf_nat, conf_rp_sup_nat = _rp_plot_data(
-        nat_array, fit_function, 'C1', 'NAT', ax, direction, bootstrap_ci, boot_size
+    conf_rp_inf_nat, conf_rp_sup_nat = _rp_plot_draw(
+        nat_array, rp_data_nat, 'C1', 'NAT', ax
     )
 
     ax.axhline(thresh, color='k', ls='--')
 
     # add return period estimate for ALL
-    idx = find_nearest(thresh, all_array)
+    idx = find_nearest_sorted(thresh, all_array, direction == 'descending')
     ymin, ymax = ax.get_ylim()
     ax.axvspan(
         conf_rp_inf_all[idx], conf_rp_sup_all[idx], 
@@ -631,7 +1512,7 @@ def rp_plot(
     )
 
     # add return period estimate for NAT
-    idx = find_nearest(thresh, nat_array)
+    idx = find_nearest_sorted(thresh, nat_array, direction == 'descending')
     ax.axvspan(
         conf_rp_inf_nat[idx], conf_rp_sup_nat[idx], 
         ymin=0, ymax=(thresh - ymin)/ (ymax - ymin),
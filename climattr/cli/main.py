@@ -1,4 +1,5 @@
 import argparse
+import sys
 
 from climattr.cli.parsers import (
     parser_filter_area,
@@ -11,47 +12,52 @@ from climattr.cli.parsers import (
     parser_xclim,
     parser_scaling
 )
-from climattr.cli.methods import (
-    method_filter_area,
-    method_filter_time,
-    method_attribution_metrics,
-    method_attribution_plot,
-    method_qq_plot,
-    method_validation_plot,
-    method_exploratory_plot,
-    method_xclim,
-    method_scaling
-)
 
-def main():
+# subcommand name -> (function adding its parser, name of its handler in 
+# climattr.cli.methods). The handlers module pulls in xarray and scipy, so it 
+# is only imported once a command runs
+_COMMANDS = {
+    'filter-area': (parser_filter_area, 'method_filter_area'),
+    'filter-time': (parser_filter_time, 'method_filter_time'),
+    'attr-metrics': (parser_attribution_metrics, 'method_attribution_metrics'),
+    'attr-plot': (parser_attribution_plot, 'method_attribution_plot'),
+    'qq-plot': (parser_qq_plot, 'method_qq_plot'),
+    'validation-plot': (parser_validation_plot, 'method_validation_plot'),
+    'exploratory-plot': (parser_exploratory_plot, 'method_exploratory_plot'),
+    'xclim-indice': (parser_xclim, 'method_xclim'),
+    'scale': (parser_scaling, 'method_scaling'),
+}
+
+def _sniff_command(argv):
+
+    # the top level parser only takes -h, so the first positional token is 
+    # the subcommand. None when it is missing or unknown, in which case every
+    # subparser is built so help and error messages list all the commands
+    for token in argv:
+        if not token.startswith('-'):
+            return token if token in _COMMANDS else None
+    return None
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(description="Run Extreme Event Attribution")
-    subparsers = parser.add_subparsers(dest='command')
-
-    parser_filter_area(subparsers)
-    parser_filter_time(subparsers)
-    parser_attribution_metrics(subparsers)
-    parser_attribution_plot(subparsers)
-    parser_qq_plot(subparsers)
-    parser_validation_plot(subparsers)
-    parser_exploratory_plot(subparsers)
-    parser_xclim(subparsers)
-    parser_scaling(subparsers)
-    
-    args = parser.parse_args()
-    
-    methods = {
-        'filter-time': method_filter_time,
-        'filter-area': method_filter_area,
-        'attr-metrics': method_attribution_metrics,
-        'attr-plot': method_attribution_plot,
-        'qq-plot': method_qq_plot,
-        'validation-plot': method_validation_plot,
-        'exploratory-plot': method_exploratory_plot,
-        'xclim-indice': method_xclim,
-        'scale': method_scaling
-    }
-
-    methods[args.command](args)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    command = _sniff_command(argv)
+    if command is not None:
+        add_parser, _ = _COMMANDS[command]
+        add_parser(subparsers)
+    else:
+        for add_parser, _ in _COMMANDS.values():
+            add_parser(subparsers)
+
+    args = parser.parse_args(argv)
+
+    from climattr.cli import methods
+    _, handler = _COMMANDS[args.command]
+    getattr(methods, handler)(args)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
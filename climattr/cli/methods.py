@@ -1,21 +1,246 @@
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from glob import glob
+from itertools import repeat
+
+import cftime
+import netCDF4
+import numpy as np
 import xarray as xr
-import xclim
-
-import scipy.stats
 
 import climattr as eea
 
-def _read_file(args, option):
-
-    # Load datasets based on the selected data source
-    if args.data_source == 'multi-file':
-        data = eea.utils.multiens_netcdf(option, chunks={'time': 100})
-    elif args.data_source == 'single-file':
-        data = xr.open_mfdataset(option, chunks={'time': 100})
+# Files of a CMIP-like dataset share their non-time coordinates, so only
+# concatenate what depends on time and take everything else from the first
+# file instead of comparing it across files. Files are opened in parallel
+# through dask.delayed on the default threaded scheduler, and naming the
+# engine skips probing the header of every file to guess its format.
+_OPEN_KWARGS = {
+    'engine': 'netcdf4',
+    'parallel': True,
+    'data_vars': 'minimal',
+    'coords': 'minimal',
+    'compat': 'override',
+    'combine': 'by_coords',
+}
+
+_DEFAULT_CHUNKS = {'time': 100}
+
+def _disk_chunks(ifile, variable):
+
+    # dask chunks aligned with the HDF5 chunks of the file, so every task 
+    # reads whole chunks from disk instead of slicing through them. Small disk
+    # chunks (CMOR writes time=1) are grouped up to the default chunk size,
+    # otherwise the graph would hold one task per time step
+    if variable is None:
+        return None
+
+    with netCDF4.Dataset(ifile) as nc:
+        if variable not in nc.variables:
+            return None
+        var = nc.variables[variable]
+        chunking = var.chunking()
+        # netCDF3/classic files have no chunking and return None
+        if chunking is None or chunking == 'contiguous':
+            return None
+        dimensions = var.dimensions
+
+    chunks = {}
+    for dim, size in zip(dimensions, chunking):
+        target = _DEFAULT_CHUNKS.get(dim, size)
+        chunks[dim] = -(-target // size) * size
+
+    return chunks
+
+# attributes that decode_cf reads to turn the stored numbers into values
+_DECODING_ATTRS = (
+    'units', 'calendar', 'scale_factor', 'add_offset', '_FillValue',
+    'missing_value',
+)
+
+def _decoding_signature(ds):
+
+    # decoding attributes of every variable left in an undecoded file, the 
+    # time axis included
+    return {
+        name: tuple(str(var.attrs.get(attr)) for attr in _DECODING_ATTRS)
+        for name, var in ds.variables.items()
+    }
+
+def _select_variable(ds, variable):
+
+    # when the files are opened undecoded, auxiliary coordinates listed in 
+    # the CF coordinates attribute are still data variables and must be kept
+    # for decode_cf to turn them back into coordinates
+    if variable not in ds.variables:
+        source = ds.encoding.get('source', 'one of the input files')
+        raise ValueError(f"Variable '{variable}' not found in {source}")
+    names = [variable] + ds[variable].attrs.get('coordinates', '').split()
+
+    return ds[[name for name in names if name in ds.variables]]
+
+def _preprocess(ds, variable, signatures):
+
+    # runs on every file inside the parallel open. Files are reduced to the
+    # requested variable, and their decoding attributes are recorded so the 
+    # combined dataset is only decoded once when they all agree
+    if variable is not None:
+        ds = _select_variable(ds, variable)
+    signatures.append(_decoding_signature(ds))
+
+    return ds
+
+def _read_file(args, option, lazy=True):
+
+    ifiles = sorted(glob(option))
+    chunks = getattr(args, 'chunks', None)
+    variable = getattr(args, 'variable', None)
+    single = args.data_source == 'single-file' and len(ifiles) == 1
+
+    # a single file that is loaded right away has no use for a dask graph.
+    # Commands that write their result keep it lazy, so it is streamed to
+    # disk chunk by chunk instead of being held in memory
+    if single and not lazy and not chunks:
+        return xr.open_dataset(ifiles[0], engine='netcdf4')
+
+    if not chunks and ifiles:
+        chunks = _disk_chunks(ifiles[0], variable)
+    if not chunks:
+        chunks = _DEFAULT_CHUNKS
+
+    # a single file has nothing to combine, so open it directly
+    if single:
+        return xr.open_dataset(ifiles[0], engine='netcdf4', chunks=chunks)
+
+    def open_files(decode_cf):
+        signatures = []
+        open_kwargs = dict(
+            _OPEN_KWARGS,
+            chunks=chunks,
+            decode_cf=decode_cf,
+            preprocess=partial(
+                _preprocess, variable=variable, signatures=signatures
+            ),
+        )
+        if args.data_source == 'multi-file':
+            data = eea.utils.multiens_netcdf(option, **open_kwargs)
+        elif args.data_source == 'single-file':
+            data = xr.open_mfdataset(option, **open_kwargs)
+        return data, signatures
+
+    # Load datasets based on the selected data source. CF decoding, times
+    # included, runs once on the combined dataset when every file shares the
+    # decoding attributes of the first one. A later CMIP segment may count 
+    # time from another reference date or pack values with another scale 
+    # factor, and then the files are opened again and decoded one by one
+    data, signatures = open_files(decode_cf=False)
+    if signatures and all(
+        signature == signatures[0] for signature in signatures[1:]
+    ):
+        return xr.decode_cf(data)
+
+    data, _ = open_files(decode_cf=True)
 
     return data
 
+def _read_variable(args, option):
+
+    # only cast when --precision is given, so by default the samples keep the
+    # dtype read from disk. The cast runs while the variable is still lazy, so
+    # each dask chunk is converted as it is read
+    variable = _read_file(args, option, lazy=False)[args.variable]
+    precision = getattr(args, 'precision', None)
+    if precision:
+        variable = variable.astype(precision, copy=False)
+
+    return variable.load()
+
+def _read_variables(args, *options):
+
+    # the plot routines convert their inputs to numpy more than once, so read
+    # every distinct path a single time and keep the variable in memory. The
+    # reads are independent and mostly wait on disk, so they overlap in threads
+    unique = list(dict.fromkeys(options))
+    with ThreadPoolExecutor(max_workers=len(unique)) as executor:
+        loaded = dict(zip(
+            unique, executor.map(_read_variable, repeat(args), unique)
+        ))
+
+    return [loaded[option] for option in options]
+
+def _fit_function(args):
+
+    # scipy.stats takes a noticeable share of the start up time, and the 
+    # filter, xclim and scale commands never fit a distribution
+    import scipy.stats
+
+    return getattr(scipy.stats, args.fit_function)
+
+def _pyplot():
+
+    # figures are only ever written to disk, so use the non interactive Agg 
+    # backend instead of probing for a GUI one
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    return plt
+
+_PACKING_KEYS = ('dtype', 'scale_factor', 'add_offset', '_FillValue')
+
+_TIME_UNITS = 'days since 1850-01-01'
+
+def _time_encoding(time):
+
+    # whole days since 1850 fit in an int32, which halves the time axis on 
+    # disk and compresses better than float64. Sub-daily or mid-month time 
+    # stamps would be truncated, so those stay float64
+    encoding = {'units': _TIME_UNITS, 'dtype': 'float64'}
+    values = time.values
+    if np.issubdtype(values.dtype, np.datetime64):
+        days = (values - np.datetime64('1850-01-01')) / np.timedelta64(1, 'D')
+    elif values.size:
+        # cftime dates of a non standard calendar
+        days = cftime.date2num(values, _TIME_UNITS, values[0].calendar)
+    else:
+        days = np.zeros(0)
+    if (
+        np.all(days == np.round(days))
+        and np.all(np.abs(days) < np.iinfo(np.int32).max)
+    ):
+        encoding['dtype'] = 'int32'
+    encoding.update(zlib=True, complevel=4)
+
+    return encoding
+
+def _write_file(data, ofile):
+
+    if isinstance(data, xr.Dataset):
+        variables = data.data_vars
+    else:
+        variables = {data.name: data}
+
+    # compress every numeric variable, keeping any packing read from the 
+    # input, and use the dask chunks as the HDF5 chunks so the output is read
+    # back along the same blocks it was written in
+    encoding = {}
+    if 'time' in data.coords:
+        encoding['time'] = _time_encoding(data['time'])
+    for name, var in variables.items():
+        if name is None or var.ndim == 0 or var.dtype.kind not in 'biuf':
+            continue
+        encoding[name] = {
+            key: value for key, value in var.encoding.items()
+            if key in _PACKING_KEYS
+        }
+        encoding[name].update(zlib=True, complevel=4)
+        if var.chunks:
+            encoding[name]['chunksizes'] = tuple(
+                chunk[0] for chunk in var.chunks
+            )
+
+    data.to_netcdf(ofile, encoding=encoding)
+
 #####################################################################
 
 def method_filter_time(args):
@@ -30,10 +255,7 @@ def method_filter_time(args):
     else:
         raise ValueError('You should either add months argument of itime,etime')
 
-    data[[args.variable]].to_netcdf(
-        args.ofile, 
-        encoding={'time':{'units':'days since 1850-01-01', 'dtype': 'float64'}}
-    )
+    _write_file(data[[args.variable]], args.ofile)
 
 #####################################################################
 
@@ -53,27 +275,25 @@ def method_filter_area(args):
         data = getattr(data, args.reduce)(
             dim=eea.utils.get_xy_coords(data), keep_attrs=True
         )
-    data[[args.variable]].to_netcdf(
-        args.ofile, 
-        encoding={'time':{'units':'days since 1850-01-01', 'dtype': 'float64'}}
-    )
+    _write_file(data[[args.variable]], args.ofile)
 
 #####################################################################
 
 def method_attribution_metrics(args):
 
-    all_data = _read_file(args, args.all)
-    nat_data = _read_file(args, args.nat)
+    all_data, nat_data = _read_variables(args, args.all, args.nat)
 
-    fit_function = getattr(scipy.stats, args.fit_function)
+    fit_function = _fit_function(args)
 
     metrics = eea.attribution.attribution_metrics(
-        all_data[args.variable], 
-        nat_data[args.variable], 
+        all_data, 
+        nat_data, 
         fit_function, 
         args.thresh, 
         bootstrap_ci=95,
-        direction='descending'
+        direction='descending',
+        n_jobs=args.n_jobs,
+        fit_method=args.fit_method
     )
     
     # print metrics
@@ -85,25 +305,26 @@ def method_attribution_metrics(args):
 
 def method_attribution_plot(args):
 
-    all_data = _read_file(args, args.all)
-    nat_data = _read_file(args, args.nat)
+    plt = _pyplot()
+
+    all_data, nat_data = _read_variables(args, args.all, args.nat)
 
-    fit_function = getattr(scipy.stats, args.fit_function)
+    fit_function = _fit_function(args)
 
     fig, [ax1, ax2] = plt.subplots(1, 2, figsize=(8,4))
 
     eea.attribution.histogram_plot(
         ax1,
-        all_data[args.variable], 
-        nat_data[args.variable], 
+        all_data, 
+        nat_data, 
         fit_function, 
         args.thresh, 
     )
 
     eea.attribution.rp_plot(
         ax2,
-        all_data[args.variable], 
-        nat_data[args.variable], 
+        all_data, 
+        nat_data, 
         fit_function, 
         args.thresh, 
         direction=args.direction,
@@ -122,15 +343,22 @@ def method_attribution_plot(args):
 
 def method_qq_plot(args):
 
-    all_data = _read_file(args, args.all)
-    obs_data = _read_file(args, args.obs)
+    plt = _pyplot()
 
-    fit_function = getattr(scipy.stats, args.fit_function)
+    all_data, obs_data = _read_variables(args, args.all, args.obs)
+
+    fit_function = _fit_function(args)
 
     fig, [ax1, ax2] = plt.subplots(1, 2, figsize=(8,4))
 
-    eea.validation.qq_plot_theoretical(ax1, obs_data[args.variable], fit_function)
-    eea.validation.qq_plot_theoretical(ax2, all_data[args.variable], fit_function)
+    # one image per marker line instead of one path per sample in vector 
+    # outputs such as PDF
+    eea.validation.qq_plot_theoretical(
+        ax1, obs_data, fit_function, rasterized=True
+    )
+    eea.validation.qq_plot_theoretical(
+        ax2, all_data, fit_function, rasterized=True
+    )
 
     ax1.set_title('OBS')
     ax2.set_title('ALL')
@@ -147,16 +375,17 @@ def method_qq_plot(args):
 
 def method_validation_plot(args):
 
-    all_data = _read_file(args, args.all)
-    obs_data = _read_file(args, args.obs)
+    plt = _pyplot()
+
+    all_data, obs_data = _read_variables(args, args.all, args.obs)
 
-    fit_function = getattr(scipy.stats, args.fit_function)
+    fit_function = _fit_function(args)
 
     fig, [ax1, ax2] = plt.subplots(1, 2, figsize=(8,4))
 
     #eea.validation.qq_plot(ax, nat['tas'], all['tas'])
-    eea.validation.histogram_plot(ax1, obs_data[args.variable], all_data[args.variable], fit_function)
-    eea.validation.qq_plot(ax2, obs_data[args.variable], all_data[args.variable])
+    eea.validation.histogram_plot(ax1, obs_data, all_data, fit_function)
+    eea.validation.qq_plot(ax2, obs_data, all_data, rasterized=True)
 
     ax1.set_xlabel(args.variable)
     ax1.set_ylabel('PDF')
@@ -170,20 +399,22 @@ def method_validation_plot(args):
 
 def method_exploratory_plot(args):
 
-    data = _read_file(args, args.ifile)
+    plt = _pyplot()
+
+    [data] = _read_variables(args, args.ifile)
 
-    fit_function = getattr(scipy.stats, args.fit_function)
+    fit_function = _fit_function(args)
 
     fig, [ax1, ax2] = plt.subplots(1, 2, figsize=(8,4))
 
     eea.exploratory.timeseries_plot(
         ax1, 
-        data[args.variable], 
+        data, 
         highlight_year=args.year
     )
     eea.exploratory.rp_plot(
         ax2, 
-        data[args.variable], 
+        data, 
         fit_function, 
         highlight_year=args.year
     )
@@ -203,13 +434,13 @@ def method_xclim(args):
     data = _read_file(args, args.ifile)
 
     indice = eea.indice.xclim_indice(
-        data, args.xclim_function, **args.kwargs
+        data, 
+        args.xclim_function, 
+        check_missing='skip' if args.skip_missing_check else 'pct',
+        **args.kwargs
     )
 
-    indice.to_netcdf(
-        args.ofile, 
-        encoding={'time':{'units':'days since 1850-01-01', 'dtype': 'float64'}}
-    )
+    _write_file(indice, args.ofile)
 
 #####################################################################
 
@@ -226,9 +457,6 @@ def method_scaling(args):
         method = args.method
     )
 
-    scaled_data.to_netcdf(
-        args.ofile, 
-        encoding={'time':{'units':'days since 1850-01-01', 'dtype': 'float64'}}
-    )
+    _write_file(scaled_data, args.ofile)
 
 #####################################################################
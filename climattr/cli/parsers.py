@@ -5,135 +5,69 @@ class ParseKwargs(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
         setattr(namespace, self.dest, dict())
         for value in values:
-            key, value = value.split('=')
+            key, _, value = value.partition('=')
             getattr(namespace, self.dest)[key] = value
 
-#####################################################################
-
-def parser_filter_area(subparsers):
+class ParseChunks(argparse.Action):
 
-    parser = subparsers.add_parser(
-        'filter-area', 
-        help='Function used to filter the dataset based on a spatial filter',
-    )
-    parser.add_argument(
-        '-i', '--ifile', 
-        required=True,
-        help="Path to the input dataset"
-    )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
-    )
-    parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
-    )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
-    )
-    parser.add_argument(
-        '--box', 
-        nargs='+',
-        required=False, 
-        help='Box used to filter the dataset latitude and longitude'
-    )
-    parser.add_argument(
-        '--mask', 
-        required=False, 
-        help='Path for the shapefile name used to filter the dataset'
-    )
-    parser.add_argument(
-        '--reduce',
-        required=False,
-        choices=['mean', 'min', 'max'],
-        help="Statistical function to apply after area filtering (mean, min, or max)"
-    )
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, dict())
+        for value in values:
+            dim, _, size = value.partition('=')
+            getattr(namespace, self.dest)[dim] = int(size)
 
 #####################################################################
 
-def parser_filter_time(subparsers):
+# arguments shared between subcommands, declared once so every command
+# exposes them with the same flags, defaults and help
 
-    parser = subparsers.add_parser(
-        'filter-time', 
-        help='Function used to filter the dataset based on initial and final time'
-    )
+def _add_ifile(parser):
     parser.add_argument(
-        '-i', '--ifile', 
+        '-i', '--ifile',
         required=True,
         help="Path to the input dataset"
     )
+
+def _add_ofile(parser):
     parser.add_argument(
         '-o', '--ofile',
         required=True,
         help="Path to the output dataset"
     )
+
+def _add_all_nat(parser):
     parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
+        '-a', '--all',
         required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
+        help="Path to the 'all' dataset files"
     )
     parser.add_argument(
-        '-v', '--variable',
+        '-n', '--nat',
         required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
-    )
-    parser.add_argument(
-        '--itime', 
-        required=False, 
-        help='Initial time used to filter the dataset in the format YYYY-mm-dd'
-    )
-    parser.add_argument(
-        '--etime', 
-        required=False, 
-        help='End time used to filter the dataset in the format YYYY-mm-dd'
-    )
-    parser.add_argument(
-        '--months', 
-        nargs='+',
-        required=False, 
-        help='Select just specific months from the dataset'
+        help="Path to the 'nat' dataset files"
     )
 
-#####################################################################
-
-def parser_attribution_metrics(subparsers):
-
-    parser = subparsers.add_parser(
-        'attr-metrics', 
-        help='Function used calculate the attribution metrics (PR, RP, FAR)'
-    )
+def _add_all_obs(parser):
     parser.add_argument(
-        '-a', '--all', 
+        '-a', '--all',
         required=True,
         help="Path to the 'all' dataset files"
     )
     parser.add_argument(
-        '-n', '--nat', 
+        '--obs',
         required=True,
-        help="Path to the 'nat' dataset files"
-    )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
+        help="Path to the observational dataset files"
     )
+
+def _add_data_source(parser):
     parser.add_argument(
-        '-d', '--data-source', 
+        '-d', '--data-source',
         choices=['multi-file', 'single-file'],
         required=True,
         help="Specify the data source type: 'multi-file' or 'single-file'"
     )
+
+def _add_variable(parser):
     parser.add_argument(
         '-v', '--variable',
         required=True,
@@ -141,12 +75,16 @@ def parser_attribution_metrics(subparsers):
         default='tas',
         help="Variable name to use for attribution metrics (default: 'tas')"
     )
+
+def _add_fit_function(parser):
     parser.add_argument(
         '-f', '--fit_function',
         type=str,
         default='norm',
         help="Scipy fit function to use for attribution metrics (default: 'norm')"
     )
+
+def _add_thresh_direction(parser):
     parser.add_argument(
         '-t', '--thresh',
         type=float,
@@ -160,262 +98,238 @@ def parser_attribution_metrics(subparsers):
         help="Direction for the bootstrap ordering that will be used to calculate RP"
     )
 
+def _add_chunks(parser):
+    parser.add_argument(
+        '--chunks',
+        nargs='+',
+        action=ParseChunks,
+        help="Dask chunk sizes as dim=size pairs (default: the on-disk chunks of the variable)"
+    )
+
+def _add_precision(parser):
+    parser.add_argument(
+        '--precision',
+        choices=['float32', 'float64'],
+        default=None,
+        help="Cast the samples handed to the fits to this floating point precision; float32 halves memory traffic at the cost of bit exactness (default: keep the precision of the input)"
+    )
+
 #####################################################################
 
-def parser_attribution_plot(subparsers):
+def parser_filter_area(subparsers):
 
     parser = subparsers.add_parser(
-        'attr-plot', 
-        help='Function used to plot attribution histogram and RP'
-    )
-    parser.add_argument(
-        '-a', '--all', 
-        required=True,
-        help="Path to the 'all' dataset files"
+        'filter-area',
+        help='Function used to filter the dataset based on a spatial filter',
     )
+    _add_ifile(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
     parser.add_argument(
-        '-n', '--nat', 
-        required=True,
-        help="Path to the 'nat' dataset files"
+        '--box',
+        nargs='+',
+        required=False,
+        help='Box used to filter the dataset latitude and longitude'
     )
     parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
+        '--mask',
+        required=False,
+        help='Path for the shapefile name used to filter the dataset'
     )
     parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
+        '--reduce',
+        required=False,
+        choices=['mean', 'min', 'max'],
+        help="Statistical function to apply after area filtering (mean, min, or max)"
     )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
+    _add_chunks(parser)
+
+    return parser
+
+#####################################################################
+
+def parser_filter_time(subparsers):
+
+    parser = subparsers.add_parser(
+        'filter-time',
+        help='Function used to filter the dataset based on initial and final time'
     )
+    _add_ifile(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
     parser.add_argument(
-        '-f', '--fit_function',
-        type=str,
-        default='norm',
-        help="Scipy fit function to use for attribution metrics (default: 'norm')"
+        '--itime',
+        required=False,
+        help='Initial time used to filter the dataset in the format YYYY-mm-dd'
     )
     parser.add_argument(
-        '-t', '--thresh',
-        type=float,
-        default=301,
-        help="Threshold value for the attribution metrics (default: 301)"
+        '--etime',
+        required=False,
+        help='End time used to filter the dataset in the format YYYY-mm-dd'
     )
     parser.add_argument(
-        '--direction',
-        choices=['descending', 'ascending'],
-        default='descending',
-        help="Direction for the bootstrap ordering that will be used to calculate RP"
+        '--months',
+        nargs='+',
+        required=False,
+        help='Select just specific months from the dataset'
     )
+    _add_chunks(parser)
+
+    return parser
 
 #####################################################################
 
-def parser_qq_plot(subparsers):
+def parser_attribution_metrics(subparsers):
 
     parser = subparsers.add_parser(
-        'qq-plot', 
-        help='Function used for QQ-Plot against theoretical quantiles'
-    )
-    parser.add_argument(
-        '-a', '--all', 
-        required=True,
-        help="Path to the 'all' dataset files"
-    )
-    parser.add_argument(
-        '--obs', 
-        required=True,
-        help="Path to the observational dataset files"
+        'attr-metrics',
+        help='Function used calculate the attribution metrics (PR, RP, FAR)'
     )
+    _add_all_nat(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
+    _add_fit_function(parser)
+    _add_thresh_direction(parser)
     parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
+        '--fit-method',
+        choices=['mle', 'lmoments'],
+        default='mle',
+        help="Estimator used to fit the bootstrap replicates; 'lmoments' is only available for genextreme and gumbel_r (default: 'mle')"
     )
     parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
+        '--n-jobs',
+        type=int,
+        default=1,
+        help="Number of processes used to fit the bootstrap replicates, -1 to use every core (default: 1)"
     )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
+    _add_precision(parser)
+
+    return parser
+
+#####################################################################
+
+def parser_attribution_plot(subparsers):
+
+    parser = subparsers.add_parser(
+        'attr-plot',
+        help='Function used to plot attribution histogram and RP'
     )
-    parser.add_argument(
-        '-f', '--fit_function',
-        type=str,
-        default='norm',
-        help="Scipy fit function to use for attribution metrics (default: 'norm')"
+    _add_all_nat(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
+    _add_fit_function(parser)
+    _add_thresh_direction(parser)
+    _add_precision(parser)
+
+    return parser
+
+#####################################################################
+
+def parser_qq_plot(subparsers):
+
+    parser = subparsers.add_parser(
+        'qq-plot',
+        help='Function used for QQ-Plot against theoretical quantiles'
     )
+    _add_all_obs(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
+    _add_fit_function(parser)
+    _add_precision(parser)
+
+    return parser
 
 #####################################################################
 
 def parser_validation_plot(subparsers):
 
     parser = subparsers.add_parser(
-        'validation-plot', 
+        'validation-plot',
         help='Function used for validation plot of OBS and ALL'
     )
-    parser.add_argument(
-        '-a', '--all', 
-        required=True,
-        help="Path to the 'all' dataset files"
-    )
-    parser.add_argument(
-        '--obs', 
-        required=True,
-        help="Path to the observational dataset files"
-    )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
-    )
-    parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
-    )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
-    )
-    parser.add_argument(
-        '-f', '--fit_function',
-        type=str,
-        default='norm',
-        help="Scipy fit function to use for attribution metrics (default: 'norm')"
-    )
+    _add_all_obs(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
+    _add_fit_function(parser)
+    _add_precision(parser)
+
+    return parser
 
 #####################################################################
 
 def parser_exploratory_plot(subparsers):
 
     parser = subparsers.add_parser(
-        'exploratory-plot', 
+        'exploratory-plot',
         help='Function used to explore the plots for OBS'
     )
-    parser.add_argument(
-        '-i', '--ifile', 
-        required=True,
-        help="Path to the input dataset"
-    )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
-    )
-    parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
-    )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
-    )
-    parser.add_argument(
-        '-f', '--fit_function',
-        type=str,
-        default='norm',
-        help="Scipy fit function to use for attribution metrics (default: 'norm')"
-    )
+    _add_ifile(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
+    _add_fit_function(parser)
     parser.add_argument(
         '-y', '--year',
         type=int,
         help="Year of the extreme event that is being analyzed"
     )
+    _add_precision(parser)
+
+    return parser
 
 #####################################################################
 
 def parser_xclim(subparsers):
 
     parser = subparsers.add_parser(
-        'xclim-indice', 
+        'xclim-indice',
         help='Function used to wrap xclim library and calculate the indice'
     )
+    _add_ifile(parser)
+    _add_ofile(parser)
+    _add_data_source(parser)
     parser.add_argument(
-        '-i', '--ifile', 
-        required=True,
-        help="Path to the input dataset"
-    )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
-    )
-    parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
-    )
-    parser.add_argument(
-        '--xclim-function', 
+        '--xclim-function',
         required=True,
         help="Name of the function that will calculate the indice. See: https://xclim.readthedocs.io/en/stable/api_indicators.html"
     )
     parser.add_argument(
-        '-k', '--kwargs', 
-        nargs='*', 
+        '-k', '--kwargs',
+        nargs='*',
         action=ParseKwargs,
         help='Arguments used in the xclim function. See: https://xclim.readthedocs.io/en/stable/api_indicators.html'
     )
+    parser.add_argument(
+        '--skip-missing-check',
+        action='store_true',
+        help="Skip xclim's scan for missing values; periods where every value is missing are then not masked"
+    )
+
+    return parser
 
 #####################################################################
 
 def parser_scaling(subparsers):
 
     parser = subparsers.add_parser(
-        'scale', 
+        'scale',
         help='Function used to scale data by a given climatology (add or divide)'
     )
+    _add_ifile(parser)
     parser.add_argument(
-        '-i', '--ifile', 
-        required=True,
-        help="Path to the input dataset"
-    )
-    parser.add_argument(
-        '-c', '--clim', 
+        '-c', '--clim',
         required=True,
         help="Path to the climatology dataset"
     )
-    parser.add_argument(
-        '-o', '--ofile',
-        required=True,
-        help="Path to the output dataset"
-    )
-    parser.add_argument(
-        '-d', '--data-source', 
-        choices=['multi-file', 'single-file'],
-        required=True,
-        help="Specify the data source type: 'multi-file' or 'single-file'"
-    )
-    parser.add_argument(
-        '-v', '--variable',
-        required=True,
-        type=str,
-        default='tas',
-        help="Variable name to use for attribution metrics (default: 'tas')"
-    )
+    _add_ofile(parser)
+    _add_data_source(parser)
+    _add_variable(parser)
     parser.add_argument(
         '--idate',
         type=str,
@@ -432,5 +346,8 @@ def parser_scaling(subparsers):
         default='add',
         help="Method used to scale the data (add or mult)"
     )
+    _add_chunks(parser)
+
+    return parser
 
 #####################################################################
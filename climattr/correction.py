@@ -1,15 +1,66 @@
+import operator
+
+import numpy as np
 import xarray as xr
 
 from datetime import datetime
 
+from typing import Union
+
 from climattr.validator import validate_correction_method
 
+# scaling method -> (operator applied to the DataArray, numpy ufunc applied
+# in place to its values)
+_SCALING_OPS = {
+    'add': (operator.sub, np.subtract),
+    'mult': (operator.truediv, np.divide),
+}
+
+###############################################################################
+
+def climatology_mean(
+    clim: xr.DataArray,
+    idate: datetime,
+    edate: datetime) -> float:
+    """
+    Calculate the climate mean of a climatology over a specified period.
+
+    Parameters
+    ----------
+    clim : xr.DataArray
+        The climatology data used to calculate the mean. A dask backed 
+        climatology (e.g. opened with xr.open_mfdataset and chunks) is 
+        reduced in parallel, chunk by chunk, without being loaded whole.
+    
+    idate : datetime
+        The start date of the period over which the mean is calculated.
+    
+    edate : datetime
+        The end date of the period over which the mean is calculated.
+
+    Returns
+    -------
+    float
+        The mean of the climatology over the period, which can be passed to 
+        'scaling' in place of the climatology when several arrays are scaled 
+        against the same baseline.
+    """
+    clim = clim.sel(time=slice(idate, edate))
+
+    # reduce through xarray so a dask backed climatology is averaged chunk by
+    # chunk instead of being loaded whole. skipna=False keeps numpy's rule 
+    # that a missing value makes the mean missing
+    return float(clim.mean(skipna=False).values)
+
+###############################################################################
+
 def scaling(
     data: xr.DataArray,
-    clim: xr.DataArray,
+    clim: Union[xr.DataArray, float],
     idate: datetime,
     edate: datetime,
-    method: str = 'add') -> xr.DataArray:
+    method: str = 'add',
+    inplace: bool = False) -> xr.DataArray:
     """
     Scale the input data by adjusting it based on the climate mean over a 
     specified period. The scaling can be done either by subtracting the mean 
@@ -19,42 +70,61 @@ def scaling(
     ----------
     data : xr.DataArray
         The data to be scaled, typically representing climate variables 
-        (e.g., temperature, precipitation).
+        (e.g., temperature, precipitation). Dask backed data stays lazy.
     
-    clim : xr.DataArray
+    clim : xr.DataArray or float
         The climatology data used to calculate the mean for scaling. This 
-        should cover the same variable as 'data' over a baseline period.
+        should cover the same variable as 'data' over a baseline period. A 
+        mean already computed with 'climatology_mean' is used as is.
     
     idate : datetime
-        The start date of the period over which the climatology mean is calculated.
+        The start date of the period over which the climatology mean is 
+        calculated. Ignored when 'clim' is already a mean.
     
     edate : datetime
-        The end date of the period over which the climatology mean is calculated.
+        The end date of the period over which the climatology mean is 
+        calculated. Ignored when 'clim' is already a mean.
     
     method : str, optional, default = 'add'
         The method of scaling. If 'add', the climate mean is subtracted 
         from the data (additive scaling). If 'mult', the data is divided 
         by the climate mean (multiplicative scaling).
+    
+    inplace : bool, optional, default = False
+        If True, 'data' is overwritten with the scaled values and returned, 
+        which avoids allocating a second array of the same size. Only numpy 
+        backed, floating point data can be scaled in place.
 
     Returns
     -------
     xr.DataArray
         The scaled data array, with adjustments applied based on the 
         specified method and climatology mean.
+
+    Raises
+    ------
+    ValueError
+        If 'inplace' is True and 'data' is not a floating point numpy array.
     """
     # validate method
     validate_correction_method(method)
 
-    # calculate climate mean
-    clim = clim.sel(time=slice(idate, edate))
-    clim = clim.to_numpy().flatten().mean()
+    # calculate climate mean, unless the caller already did
+    if isinstance(clim, xr.DataArray):
+        clim = climatology_mean(clim, idate, edate)
+
+    scale_op, scale_ufunc = _SCALING_OPS[method]
 
-    if method == 'add':
-        scaled_data = data - clim
-    else:
-        scaled_data = data / clim
+    if inplace:
+        values = data.data
+        if not isinstance(values, np.ndarray) or values.dtype.kind != 'f':
+            raise ValueError(
+                'Only numpy backed, floating point data can be scaled in place'
+            )
+        scale_ufunc(values, clim, out=values)
+        return data
 
-    return scaled_data
+    return scale_op(data, clim)
 
 ###############################################################################
 
@@ -7,7 +7,7 @@ import matplotlib.pyplot as plt
 import scipy.stats
 
 from climattr.attribution import _rp_plot_data
-from climattr.utils import find_nearest
+from climattr.utils import find_nearest_sorted
 from climattr.validator import (
     validate_ci,
     validate_direction
@@ -97,7 +97,8 @@ def rp_plot(
     highlight_year: int | None = 1999,
     direction: str = 'descending',
     bootstrap_ci: int = 95,
-    boot_size: int = 1000) -> None:
+    boot_size: int = 1000,
+    rng: int | np.random.Generator | None = None) -> None:
     """
     Plot a return period graph on the given axis with optional highlighting 
     of a specific year and confidence intervals.
@@ -127,6 +128,9 @@ def rp_plot(
     boot_size : int, optional, default = 1000
         The number of bootstrap samples to be used.
 
+    rng : None, int or numpy.random.Generator, optional, default = None
+        Seed or random generator used to draw the bootstrap samples.
+
     Returns
     -------
     None
@@ -136,13 +140,14 @@ def rp_plot(
     validate_ci(bootstrap_ci)
 
     dataframe = data.to_dataframe().reset_index() 
-    data_array = np.sort(dataframe[data.name].values.flatten())
+    data_array = np.sort(dataframe[data.name].values.ravel())
 
     if direction == 'descending':
         data_array = data_array[::-1]
 
     conf_rp_inf, conf_rp_sup = _rp_plot_data(
-        data_array, fit_function, 'C0', 'OBS', ax, direction, bootstrap_ci, boot_size
+        data_array, fit_function, 'C0', 'OBS', ax, direction, bootstrap_ci, 
+        boot_size, rng
     )
 
     if highlight_year:
@@ -162,7 +167,7 @@ def rp_plot(
         ) 
 
         # add return period estimate for OBS
-        idx = find_nearest(thresh, data_array)
+        idx = find_nearest_sorted(thresh, data_array, direction == 'descending')
         ymin, ymax = ax.get_ylim()
         ax.axvspan(
             conf_rp_inf[idx], conf_rp_sup[idx], 
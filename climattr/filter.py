@@ -1,4 +1,5 @@
 import geopandas as gpd
+import numpy as np
 import xarray as xr
 
 import cartopy.crs as ccrs
@@ -158,8 +159,9 @@ def filter_time(
     
     months : list or None, optional
         A list of integers representing the months (e.g., [1, 2, 12] for January, 
-        February, and December) to filter by. If set to None, no month-based 
-        filtering will be applied. The default is None.
+        February, and December) to filter by. Time steps in other months are 
+        dropped. If set to None, no month-based filtering will be applied. The 
+        default is None.
     
     Returns
     -------
@@ -170,7 +172,11 @@ def filter_time(
     if itime and etime:
         dataset = dataset.sel(time=slice(itime, etime))
     if months:
-        dataset = dataset.where(dataset['time.month'].isin(months))
+        # lookup table indexed by month number, so selecting the months is a
+        # single gather over the time axis instead of a membership test
+        month_mask = np.zeros(13, dtype=bool)
+        month_mask[months] = True
+        dataset = dataset.isel(time=month_mask[dataset['time.month'].values])
 
     return dataset
 
@@ -4,6 +4,7 @@ import xclim
 def xclim_indice(
     dataset: xr.Dataset,
     xclim_function: str,
+    check_missing: str = 'pct',
     **kwargs) -> xr.Dataset:
     """
     Applies a specified xclim climate indicator function to an xarray dataset, 
@@ -20,6 +21,12 @@ def xclim_indice(
         The name of the xclim climate indicator function to apply. The function 
         must be part of the `xclim.indicators.atmos` module.
     
+    check_missing : str, optional
+        The xclim missing values check applied to the output periods. The 
+        default 'pct', with its tolerance of 1, masks the periods where every 
+        value is missing. 'skip' leaves out that scan of the input, so such 
+        periods get a value computed from no data (e.g. 0 for a count).
+    
     **kwargs : keyword arguments
         Additional arguments required by the specified xclim function. These 
         should be passed in a key-value format as expected by the chosen indicator 
@@ -50,7 +57,7 @@ def xclim_indice(
     
     """
     with xclim.set_options(
-        check_missing="pct",
+        check_missing=check_missing,
         missing_options={"pct": dict(tolerance=1)},
         cf_compliance="log",
         data_validation='log'
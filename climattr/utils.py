@@ -8,6 +8,7 @@ import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.io.shapereader import Reader
 from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
+from functools import lru_cache
 from glob import glob
 from typing import Union, List
 
@@ -158,6 +159,56 @@ def find_nearest(
 
 ###############################################################################
 
+def find_nearest_sorted(
+    value: float, 
+    data: np.ndarray,
+    descending: bool = False) -> int:
+    """
+    Find the index of the nearest value in a sorted numpy array.
+
+    This is equivalent to `find_nearest` but uses a binary search, so it runs 
+    in O(log n) and does not allocate a temporary array.
+
+    Parameters
+    ----------
+    value : float
+        The value to find in the array.
+    
+    data : np.ndarray
+        The sorted array in which to search for the nearest value.
+
+    descending : bool, optional
+        Whether `data` is sorted in descending order. Default is False.
+
+    Returns
+    -------
+    int
+        The index of the nearest value in the array. Ties are resolved in 
+        favour of the first occurrence, as in `find_nearest`.
+    """
+    n_samples = data.shape[0]
+
+    # search the ascending view of the data
+    sorted_data = data[::-1] if descending else data
+    right = min(int(np.searchsorted(sorted_data, value)), n_samples - 1)
+    left = max(right - 1, 0)
+
+    dist_left = abs(sorted_data[left] - value)
+    dist_right = abs(sorted_data[right] - value)
+
+    if descending:
+        nearest = sorted_data[left] if dist_left < dist_right else sorted_data[right]
+        # the first occurrence in descending order is the last one in the 
+        # ascending view
+        return n_samples - int(np.searchsorted(sorted_data, nearest, side='right'))
+
+    nearest = sorted_data[right] if dist_right < dist_left else sorted_data[left]
+    return int(np.searchsorted(sorted_data, nearest, side='left'))
+
+###############################################################################
+
+# typed, so a float confidence interval never hits the cache of an int one
+@lru_cache(maxsize=32, typed=True)
 def get_percentiles_from_ci(cofidence_interval: int) -> tuple:
     """
     Calculate the lower and upper percentile bounds from a given confidence 
@@ -187,6 +238,65 @@ def get_percentiles_from_ci(cofidence_interval: int) -> tuple:
 
 ###############################################################################
 
+def _lerp(
+    below: np.ndarray, 
+    above: np.ndarray, 
+    gamma: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation between neighbouring order statistics, in the 
+    numerically stable form `np.percentile` also uses.
+    """
+    with np.errstate(invalid='ignore'):
+        diff = above - below
+        return np.where(
+            gamma >= 0.5, above - diff * (1 - gamma), below + diff * gamma
+        )
+
+###############################################################################
+
+def sorted_percentiles(
+    sorted_data: np.ndarray, 
+    percentiles: Union[float, List[float], np.ndarray]) -> np.ndarray:
+    """
+    Calculate percentiles along the last axis of data that is already sorted.
+
+    The result agrees with `np.percentile(data, percentiles, axis=-1)` with 
+    the default linear interpolation up to floating point rounding, but reads
+    the order statistics directly instead of partitioning the data once more.
+
+    Parameters
+    ----------
+    sorted_data : np.ndarray
+        An array sorted in ascending order along its last axis.
+
+    percentiles : float, list of float or np.ndarray
+        The percentiles to calculate, between 0 and 100.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (len(percentiles),) + sorted_data.shape[:-1] with the 
+        calculated percentiles. Rows containing nan give nan, as in numpy.
+    """
+    percentiles = np.asarray(percentiles, dtype=float)
+    n_samples = sorted_data.shape[-1]
+
+    virtual_idx = percentiles.ravel() / 100 * (n_samples - 1)
+    prev_idx = np.floor(virtual_idx).astype(np.intp)
+    next_idx = np.minimum(prev_idx + 1, n_samples - 1)
+    gamma = (virtual_idx - prev_idx)[(...,) + (None,) * (sorted_data.ndim - 1)]
+
+    below = np.moveaxis(sorted_data[..., prev_idx], -1, 0)
+    above = np.moveaxis(sorted_data[..., next_idx], -1, 0)
+
+    result = _lerp(below, above, gamma)
+
+    # nan is sorted last, so check the maximum of each row
+    result = np.where(np.isnan(sorted_data[..., -1]), np.nan, result)
+    return result.reshape(percentiles.shape + sorted_data.shape[:-1])
+
+###############################################################################
+
 def get_xy_coords(dataset: xr.Dataset) -> tuple:
     """
     Extract the coordinate names for latitude and longitude from an xarray Dataset.
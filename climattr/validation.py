@@ -3,6 +3,7 @@ import xarray as xr
 
 import scipy.stats
 
+from climattr.attribution import _fit_cached, _probability_density
 from climattr.utils import get_fitted_percentiles
 
 def histogram_plot(
@@ -35,11 +36,11 @@ def histogram_plot(
         The function adds the histogram and line plot to the provided axis and 
         does not return anything.
     """
-    all_array = all.to_numpy().flatten()
-    obs_array = obs.to_numpy().flatten()
+    all_array = all.to_numpy().ravel()
+    obs_array = obs.to_numpy().ravel()
 
-    params_all = fit_function.fit(all_array)
-    params_obs = fit_function.fit(obs_array)
+    params_all = _fit_cached(all_array, fit_function)
+    params_obs = _fit_cached(obs_array, fit_function)
 
     ax.hist(all_array, color='C0', alpha=0.5, density=True, label='ALL')
     ax.hist(obs_array, color='k', alpha=0.5, density=True, label='OBS')
@@ -48,8 +49,11 @@ def histogram_plot(
     x_all = get_fitted_percentiles(percentiles, params_all, fit_function)
     x_obs = get_fitted_percentiles(percentiles, params_obs, fit_function)
 
-    ax.plot(x_all, fit_function.pdf(x_all, *params_all), color='C0', lw=2)
-    ax.plot(x_obs, fit_function.pdf(x_obs, *params_obs), color='k', lw=2)
+    pdf_all = _probability_density(fit_function, x_all, params_all)
+    pdf_obs = _probability_density(fit_function, x_obs, params_obs)
+
+    ax.plot(x_all, pdf_all, color='C0', lw=2)
+    ax.plot(x_obs, pdf_obs, color='k', lw=2)
 
     ax.legend()
 
@@ -58,7 +62,8 @@ def histogram_plot(
 def qq_plot(
     ax,
     obs: xr.DataArray,
-    all: xr.DataArray) -> None:
+    all: xr.DataArray,
+    rasterized: bool = False) -> None:
     """
     Generate a quantile-quantile plot to compare quantiles of observed data 
     against model data.
@@ -73,6 +78,10 @@ def qq_plot(
     
     all : xr.DataArray
         The model or simulated data.
+    
+    rasterized : bool, optional
+        If True, the QQ markers are drawn as an image in vector outputs such 
+        as PDF. Default is False.
 
     Returns
     -------
@@ -81,13 +90,13 @@ def qq_plot(
     """
     percentiles = np.arange(1,101,1)
 
-    all_array = all.to_numpy().flatten()
-    obs_array = obs.to_numpy().flatten()
+    all_array = all.to_numpy().ravel()
+    obs_array = obs.to_numpy().ravel()
 
     all_percentiles = np.percentile(all_array, percentiles)
     obs_percentiles = np.percentile(obs_array, percentiles)
 
-    ax.plot(obs_percentiles, all_percentiles, marker='o', ls='')
+    ax.plot(obs_percentiles, all_percentiles, marker='o', ls='', rasterized=rasterized)
 
     xlims = ax.get_xlim()
     ylims = ax.get_ylim()
@@ -104,7 +113,8 @@ def qq_plot(
 def qq_plot_theoretical(
     ax,
     data: xr.DataArray,
-    fit_function) -> None:
+    fit_function,
+    rasterized: bool = False) -> None:
     """
     Generate a theoretical quantile-quantile plot to compare data quantiles against 
     a fitted theoretical distribution.
@@ -117,22 +127,25 @@ def qq_plot_theoretical(
         The data array from which quantiles are calculated.
     fit_function : statistical function
         A statistical function used to fit the data and estimate theoretical quantiles.
+    rasterized : bool, optional
+        If True, the QQ markers are drawn as an image in vector outputs such 
+        as PDF. Default is False.
 
     Returns
     -------
     None
         The function does not return anything; it directly modifies the provided axis.
     """
-    data_array = data.to_numpy().flatten()
+    data_array = data.to_numpy().ravel()
     percentiles = scipy.stats.percentileofscore(
         data_array,
         data_array
     )
 
-    params = fit_function.fit(data_array)
+    params = _fit_cached(data_array, fit_function)
     theor_percentiles = get_fitted_percentiles(percentiles, params, fit_function)
 
-    ax.plot(theor_percentiles, data_array, marker='o', ls='')
+    ax.plot(theor_percentiles, data_array, marker='o', ls='', rasterized=rasterized)
 
     xlims = ax.get_xlim()
     ylims = ax.get_ylim()
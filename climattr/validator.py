@@ -1,4 +1,4 @@
-
+import numbers
 
 def validate_ci(value):
     """
@@ -79,3 +79,57 @@ def validate_correction_method(value):
         raise ValueError("method must be either 'add' or 'mult'.")
 
 ###############################################################################
+
+def validate_n_jobs(value):
+    """
+    Validate if a given number of parallel jobs is acceptable.
+
+    Parameters
+    ----------
+    value : int
+        The number of worker processes, or -1 to use every available core.
+
+    Raises
+    ------
+    ValueError
+        If the number of jobs is not a positive integer or -1.
+
+    Returns
+    -------
+    None
+        This function does not return any value; it solely performs validation.
+    """
+    # numpy integers are accepted, booleans are not even though bool 
+    # subclasses int
+    is_integer = (
+        isinstance(value, numbers.Integral) and not isinstance(value, bool)
+    )
+    if not (is_integer and (value > 0 or value == -1)):
+        raise ValueError("n_jobs must be a positive integer or -1.")
+
+###############################################################################
+
+def validate_fit_method(value):
+    """
+    Validate if a given fitting method is one of the accepted estimators.
+
+    Parameters
+    ----------
+    value : str
+        The fitting method to validate, which can be 'mle' for maximum 
+        likelihood or 'lmoments' for the method of L-moments.
+
+    Raises
+    ------
+    ValueError
+        If the method is not 'mle' or 'lmoments'.
+
+    Returns
+    -------
+    None
+        This function does not return any value; it solely performs validation.
+    """
+    if value not in ['mle', 'lmoments']:
+        raise ValueError("fit_method must be either 'mle' or 'lmoments'.")
+
+###############################################################################
@@ -1,5 +1,6 @@
 import numpy as np
 from climattr.attribution import (
+    _EnsembleTails,
     _calc_return_time_confidence
 )
 
@@ -44,3 +45,25 @@ def test_identical_data():
     assert np.all(result[0] == result[1]), "For identical data, the lower and upper bounds should be equal."
 
 ###############################################################################
+
+def test_reproducible_with_seed():
+    """Test that a fixed seed gives the same confidence intervals."""
+    data = np.array([3.2, 1.5, 4.7, 2.8, 0.9, 3.9])
+    first = _calc_return_time_confidence(data, boot_size=50, rng=7)
+    second = _calc_return_time_confidence(data, boot_size=50, rng=7)
+    assert np.array_equal(first, second), "The same seed should give the same intervals."
+
+###############################################################################
+
+def test_ensemble_tails_match_percentile():
+    """Test that batched tails give the same percentiles as the full ensemble."""
+    ensemble = np.random.default_rng(0).normal(size=(250, 6))
+    tails = _EnsembleTails([2.5, 97.5], 250)
+    for start in range(0, 250, 40):
+        tails.update(ensemble[start:start + 40])
+
+    expected = np.percentile(ensemble, [2.5, 97.5], axis=0)
+    np.testing.assert_allclose(tails.percentiles(), expected, rtol=0, atol=1e-12)
+    assert tails.tails.shape[0] == tails.n_low + tails.n_high, "Only the tails should be kept."
+
+###############################################################################
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+
+import scipy.stats
+
+from climattr.attribution import (
+    _exceedance_probability,
+    _probability_density,
+    _return_period
+)
+
+@pytest.fixture
+def sample_params():
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.normal(10, 1, 50), rng.uniform(0.5, 3, 50)])
+
+###############################################################################
+
+@pytest.mark.parametrize('fit_function', [
+    scipy.stats.norm, scipy.stats.gumbel_r, scipy.stats.expon, scipy.stats.uniform
+])
+@pytest.mark.parametrize('direction', ['descending', 'ascending'])
+def test_closed_form_matches_scipy(sample_params, fit_function, direction):
+    """Test that closed form probabilities match the scipy distribution."""
+    # thresholds below, inside and above the support of bounded distributions
+    thresh = np.array([[5.0], [11.0], [20.0]])
+    prob = _exceedance_probability(fit_function, thresh, sample_params, direction)
+
+    if direction == 'descending':
+        expected = fit_function.sf(thresh, *sample_params.T)
+    else:
+        expected = fit_function.cdf(thresh, *sample_params.T)
+
+    assert prob.shape == (3, 50)
+    assert np.allclose(prob, expected)
+
+###############################################################################
+
+def test_single_fit_and_invalid_scale():
+    """Test a single parameter tuple and a degenerate fit."""
+    prob = _exceedance_probability(scipy.stats.norm, 1.0, (0.0, 1.0))
+    assert np.isclose(prob, scipy.stats.norm.sf(1.0))
+    assert np.isnan(_exceedance_probability(scipy.stats.norm, 1.0, (0.0, 0.0)))
+
+###############################################################################
+
+@pytest.mark.parametrize('direction', ['descending', 'ascending'])
+@pytest.mark.parametrize('thresh', [5.0, 11.0, 30.0])
+def test_genextreme_closed_form(sample_params, direction, thresh):
+    """Test the GEV closed form on both signs of c and outside the support."""
+    shape = np.linspace(-0.5, 0.5, sample_params.shape[0])
+    params = np.column_stack([shape, sample_params])
+    prob = _exceedance_probability(
+        scipy.stats.genextreme, thresh, params, direction
+    )
+
+    if direction == 'descending':
+        expected = scipy.stats.genextreme.sf(thresh, *params.T)
+    else:
+        expected = scipy.stats.genextreme.cdf(thresh, *params.T)
+
+    assert np.allclose(prob, expected)
+
+###############################################################################
+
+@pytest.mark.parametrize('fit_function, params', [
+    (scipy.stats.norm, (10, 2)),
+    (scipy.stats.gumbel_r, (10, 2)),
+    (scipy.stats.expon, (3, 4)),
+    (scipy.stats.uniform, (1, 5)),
+    (scipy.stats.genextreme, (-0.3, 10, 2)),
+    (scipy.stats.genextreme, (0.3, 10, 2)),
+])
+def test_probability_density_matches_scipy(fit_function, params):
+    """Test that closed form densities match the scipy distribution."""
+    x = np.linspace(-10, 30, 401)
+    density = _probability_density(fit_function, x, params)
+    assert np.allclose(density, fit_function.pdf(x, *params))
+
+###############################################################################
+
+def test_return_period_beyond_bounded_support():
+    """Test that values past a bounded support end give an infinite return period."""
+    data = np.array([0.5, 2.0])
+    rp = _return_period(scipy.stats.uniform, data, (0.0, 1.0))
+
+    assert rp[0] == pytest.approx(2.0)
+    assert np.isinf(rp[1])
+
+###############################################################################
@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+
+import scipy.stats
+
+from climattr.attribution import (
+    _calc_bootstrap_weights,
+    _fit_bootstrap,
+    _fit_cached,
+    _fit_weighted,
+    _weighted_lmoments
+)
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(0)
+    return rng.gumbel(10, 2, size=50)
+
+###############################################################################
+
+def test_bootstrap_weights_shape():
+    """Test that every bootstrap replicate draws n_samples values."""
+    weights = _calc_bootstrap_weights(50, boot_size=20)
+    assert weights.shape == (20, 50)
+    assert np.all(weights.sum(axis=1) == 50)
+
+###############################################################################
+
+@pytest.mark.parametrize('fit_function', [
+    scipy.stats.norm, scipy.stats.expon, scipy.stats.uniform, scipy.stats.gumbel_r
+])
+def test_fit_weighted_closed_form(sample_data, fit_function):
+    """Test that closed form fits match fitting each resampled replicate."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=10)
+    params = _fit_weighted(sample_data, weights, fit_function)
+
+    expected = np.array([
+        fit_function.fit(np.repeat(sample_data, row)) for row in weights
+    ])
+    assert params.shape == expected.shape
+    assert np.allclose(params, expected)
+
+###############################################################################
+
+def test_fit_weighted_fallback(sample_data):
+    """Test that distributions without a closed form use the generic fit."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=3)
+    params = _fit_weighted(sample_data, weights, scipy.stats.genextreme)
+    assert params.shape == (3, 3)
+
+###############################################################################
+
+def test_fit_cached(sample_data):
+    """Test that cached fits match scipy and depend on the array contents."""
+    params = _fit_cached(sample_data, scipy.stats.gumbel_r)
+    assert np.allclose(params, scipy.stats.gumbel_r.fit(sample_data))
+    assert _fit_cached(sample_data.copy(), scipy.stats.gumbel_r) is params
+
+    shifted = _fit_cached(sample_data + 1, scipy.stats.gumbel_r)
+    assert np.isclose(shifted[0], params[0] + 1)
+
+###############################################################################
+
+def test_fit_weighted_parallel(sample_data):
+    """Test that fitting replicates in several processes gives the same fits."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=4)
+    serial = _fit_weighted(sample_data, weights, scipy.stats.genextreme)
+    parallel = _fit_weighted(
+        sample_data, weights, scipy.stats.genextreme, n_jobs=2
+    )
+    assert np.allclose(serial, parallel)
+
+###############################################################################
+
+def test_fit_bootstrap_batches(sample_data):
+    """Test that batched bootstrap fits match fitting every replicate at once."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=250, rng=3)
+    expected = _fit_weighted(sample_data, weights, scipy.stats.norm)
+
+    params = _fit_bootstrap(sample_data, scipy.stats.norm, boot_size=250, rng=3)
+    assert np.array_equal(params, expected)
+
+###############################################################################
+
+def test_weighted_lmoments(sample_data):
+    """Test that weighted L-moments match the L-moments of each replicate."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=10)
+    l1, l2, t3 = _weighted_lmoments(sample_data, weights)
+
+    for i, row in enumerate(weights):
+        x = np.sort(np.repeat(sample_data, row))
+        n = x.shape[0]
+        j = np.arange(n)
+        b0 = x.mean()
+        b1 = (j / (n - 1) * x).mean()
+        b2 = (j * (j - 1) / ((n - 1) * (n - 2)) * x).mean()
+
+        assert np.isclose(l1[i], b0)
+        assert np.isclose(l2[i], 2 * b1 - b0)
+        assert np.isclose(t3[i], (6 * b2 - 6 * b1 + b0) / (2 * b1 - b0))
+
+###############################################################################
+
+@pytest.mark.parametrize('fit_function, params', [
+    (scipy.stats.genextreme, (0.15, 10, 2)),
+    (scipy.stats.genextreme, (-0.15, 10, 2)),
+    (scipy.stats.gumbel_r, (10, 2)),
+])
+def test_fit_lmoments_recovers_params(fit_function, params):
+    """Test that the L-moments estimators recover the parameters of a large sample."""
+    data = fit_function.rvs(*params, size=100000, random_state=0)
+    weights = np.ones((1, data.shape[0]), dtype=np.int32)
+    fitted = _fit_weighted(data, weights, fit_function, fit_method='lmoments')
+    assert np.allclose(fitted[0], params, atol=0.05)
+
+###############################################################################
+
+def test_fit_lmoments_unsupported(sample_data):
+    """Test that L-moments are refused for distributions without an estimator."""
+    weights = _calc_bootstrap_weights(sample_data.shape[0], boot_size=2)
+    with pytest.raises(ValueError):
+        _fit_weighted(sample_data, weights, scipy.stats.norm, fit_method='lmoments')
+
+###############################################################################
@@ -13,6 +13,8 @@ np.random.seed(42)
 # Fixture to create sample xarray DataArrays
 @pytest.fixture
 def sample_data():
+    # Reset the random seed so the samples do not depend on test order
+    np.random.seed(42)
     time = pd.date_range("2000-01-01", periods=100, freq="D")
     all_array = np.random.normal(10, 2, size=(100,))
     nat_array = np.random.normal(8, 1.5, size=(100,))
@@ -33,7 +35,8 @@ def test_attribution_metrics(sample_data):
         thresh=9.5,
         direction='descending',
         bootstrap_ci=95,
-        boot_size=100
+        boot_size=100,
+        rng=42
     )
 
     # Check if the result is a DataFrame with correct shape
@@ -41,7 +44,26 @@ def test_attribution_metrics(sample_data):
     assert result.shape == (4, 3)
     
     # Check that the values are correctly filled in the DataFrame
-    assert np.isclose(result.loc['PR', 'value'], 5.954527849810254)
-    assert np.isclose(result.loc['FAR', 'value'], 0.832060412685886)
-    assert np.isclose(result.loc['RP_ALL', 'value'], 1.530539847952145)
-    assert np.isclose(result.loc['RP_NAT', 'value'], 8.98900315155591)
+    assert np.isclose(result.loc['PR', 'value'], 3.954062674627933)
+    assert np.isclose(result.loc['FAR', 'value'], 0.7470874240382798)
+    assert np.isclose(result.loc['RP_ALL', 'value'], 1.7750234657764654)
+    assert np.isclose(result.loc['RP_NAT', 'value'], 7.045163144867358)
+
+def test_attribution_metrics_lmoments(sample_data):
+    """Test attribution_metrics with the L-moments estimator."""
+    all_data, nat_data = sample_data
+
+    result = attribution_metrics(
+        all=all_data,
+        nat=nat_data,
+        fit_function=scipy.stats.genextreme,
+        thresh=9.5,
+        boot_size=100,
+        rng=42,
+        fit_method='lmoments'
+    )
+
+    assert result.shape == (4, 3)
+    assert np.all(np.isfinite(result.to_numpy()))
+    assert np.all(result['ci_inf'] <= result['value'])
+    assert np.all(result['value'] <= result['ci_sup'])
@@ -5,7 +5,7 @@ import xarray as xr
 
 from datetime import datetime
 
-from climattr.correction import scaling
+from climattr.correction import climatology_mean, scaling
 
 
 def test_scaling_additive():
@@ -69,3 +69,78 @@ def test_scaling_invalid_method():
         scaling(data, clim, idate, edate, method="invalid")
 
 ###############################################################################
+
+def test_scaling_precomputed_mean():
+    # Create test data
+    times = pd.date_range("2023-01-01", periods=10)
+    data_values = np.random.rand(10) * 10  # Random data
+    clim_values = np.arange(10, dtype=float)  # Varying climatology
+
+    data = xr.DataArray(data_values, dims="time", coords={"time": times}, name="data")
+    clim = xr.DataArray(clim_values, dims="time", coords={"time": times}, name="clim")
+
+    # Mean over a sub period, computed once and reused
+    idate = datetime(2023, 1, 3)
+    edate = datetime(2023, 1, 6)
+    clim_mean = climatology_mean(clim, idate, edate)
+
+    assert clim_mean == pytest.approx(clim_values[2:6].mean())
+
+    for method in ("add", "mult"):
+        expected = scaling(data, clim, idate, edate, method=method)
+        result = scaling(data, clim_mean, None, None, method=method)
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-6)
+
+###############################################################################
+
+def test_scaling_inplace():
+    # Create test data
+    times = pd.date_range("2023-01-01", periods=10)
+    data_values = np.random.rand(10) * 10  # Random data
+    clim_values = np.ones(10) * 5  # Constant climatology
+
+    clim = xr.DataArray(clim_values, dims="time", coords={"time": times}, name="clim")
+
+    idate = datetime(2023, 1, 1)
+    edate = datetime(2023, 1, 10)
+
+    for method in ("add", "mult"):
+        data = xr.DataArray(
+            data_values.copy(), dims="time", coords={"time": times}, name="data"
+        )
+        expected = scaling(data, clim, idate, edate, method=method)
+        result = scaling(data, clim, idate, edate, method=method, inplace=True)
+
+        # the input itself holds the scaled values
+        assert result is data
+        np.testing.assert_allclose(data.values, expected.values, rtol=1e-6)
+
+    # integer data cannot hold the scaled values
+    data = xr.DataArray(np.arange(10), dims="time", coords={"time": times})
+    with pytest.raises(ValueError):
+        scaling(data, clim, idate, edate, inplace=True)
+
+###############################################################################
+
+def test_scaling_dask():
+    # Create chunked test data
+    times = pd.date_range("2023-01-01", periods=10)
+    data_values = np.random.rand(10) * 10  # Random data
+    clim_values = np.arange(10, dtype=float)  # Varying climatology
+
+    data = xr.DataArray(data_values, dims="time", coords={"time": times}, name="data")
+    clim = xr.DataArray(clim_values, dims="time", coords={"time": times}, name="clim")
+
+    idate = datetime(2023, 1, 1)
+    edate = datetime(2023, 1, 10)
+    expected = scaling(data, clim, idate, edate, method="add")
+
+    result = scaling(
+        data.chunk(time=3), clim.chunk(time=3), idate, edate, method="add"
+    )
+
+    # the scaled data is still a dask graph until it is computed
+    assert result.chunks is not None
+    np.testing.assert_allclose(result.compute().values, expected.values, rtol=1e-6)
+
+###############################################################################
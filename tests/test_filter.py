@@ -154,3 +154,15 @@ def test_filter_time_by_month(sample_dataset):
     assert np.array_equal(filtered_months, months)
 
 ###############################################################################
+
+def test_filter_time_by_month_drops_other_months(sample_dataset):
+    """Test that filter_time keeps only the time steps of the selected months."""
+    months = [12, 1, 2]
+
+    filtered_ds = filter_time(sample_dataset, months=months)
+
+    # the fixture covers 2000-01-01 to 2000-12-30
+    assert filtered_ds.sizes['time'] == 31 + 29 + 30
+    assert not filtered_ds['data_var'].isnull().any()
+
+###############################################################################
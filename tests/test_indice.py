@@ -41,3 +41,33 @@ def test_xclim_indice_tx_max(sample_dataset):
 
 ###############################################################################
 
+
+def test_xclim_indice_skip_missing_check(sample_dataset):
+    """Test that skipping the missing values check only changes missing periods"""
+
+    kwargs = dict(thresh='25 degC', freq='YS')
+
+    # complete data gives the same values with and without the check
+    checked = xclim_indice(
+        sample_dataset, "tx_days_above", tasmax=sample_dataset.tasmax, **kwargs
+    )
+    skipped = xclim_indice(
+        sample_dataset, "tx_days_above", check_missing="skip",
+        tasmax=sample_dataset.tasmax, **kwargs
+    )
+    np.testing.assert_array_equal(checked.values, skipped.values)
+
+    # a period where every value is missing is only masked by the check
+    missing = sample_dataset.copy()
+    missing["tasmax"] = missing.tasmax.where(False)
+    checked = xclim_indice(
+        missing, "tx_days_above", tasmax=missing.tasmax, **kwargs
+    )
+    skipped = xclim_indice(
+        missing, "tx_days_above", check_missing="skip",
+        tasmax=missing.tasmax, **kwargs
+    )
+    assert np.isnan(checked.values).all()
+    assert not np.isnan(skipped.values).any()
+
+###############################################################################
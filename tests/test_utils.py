@@ -6,9 +6,11 @@ from unittest.mock import patch, MagicMock
 from climattr.utils import (
     add_features,
     find_nearest, 
+    find_nearest_sorted,
     get_percentiles_from_ci, 
     get_xy_coords, 
-    get_fitted_percentiles
+    get_fitted_percentiles,
+    sorted_percentiles
 )
 
 def test_add_features():
@@ -46,6 +48,18 @@ def test_find_nearest():
 
 ###############################################################################
 
+def test_find_nearest_sorted():
+    rng = np.random.default_rng(0)
+    data = np.sort(rng.integers(0, 20, size=30).astype(float))
+
+    # compare against the linear search, including ties and duplicates
+    for value in np.arange(-2, 22, 0.5):
+        assert find_nearest_sorted(value, data) == find_nearest(value, data)
+        assert find_nearest_sorted(value, data[::-1], descending=True) \
+            == find_nearest(value, data[::-1])
+
+###############################################################################
+
 def test_get_percentiles_from_ci_without_mock():
     result = get_percentiles_from_ci(95)
     assert result == (2.5, 97.5)
@@ -82,3 +96,17 @@ def test_get_fitted_percentiles():
     assert isinstance(result, np.ndarray)
 
 ###############################################################################
+
+def test_sorted_percentiles():
+    """Test that percentiles of sorted rows match np.percentile."""
+    data = np.random.default_rng(0).normal(size=(4, 101))
+    data[1, 7] = np.nan
+    percentiles = [50, 2.5, 97.5]
+
+    result = sorted_percentiles(np.sort(data, axis=1), percentiles)
+    expected = np.percentile(data, percentiles, axis=1)
+
+    assert result.shape == (3, 4)
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+###############################################################################
@@ -1,9 +1,12 @@
 import pytest
+import numpy as np
 
 from climattr.validator import (
     validate_ci,
     validate_correction_method,
-    validate_direction
+    validate_direction,
+    validate_fit_method,
+    validate_n_jobs
 )
 
 def test_validate_ci_valid():
@@ -66,3 +69,31 @@ def test_validate_correction_method_invalid():
         validate_correction_method(123)  # Not a string
 
 ###############################################################################
+
+def test_validate_n_jobs():
+    # Test valid and invalid numbers of jobs
+    validate_n_jobs(1)
+    validate_n_jobs(4)
+    validate_n_jobs(-1)
+    with pytest.raises(ValueError):
+        validate_n_jobs(0)
+    with pytest.raises(ValueError):
+        validate_n_jobs(-2)
+    with pytest.raises(ValueError):
+        validate_n_jobs(2.0)  # Not an integer
+    validate_n_jobs(np.int64(2))  # numpy integers are integers
+    with pytest.raises(ValueError):
+        validate_n_jobs(True)  # Booleans are not a number of jobs
+
+###############################################################################
+
+def test_validate_fit_method():
+    # Test valid and invalid fitting methods
+    validate_fit_method('mle')
+    validate_fit_method('lmoments')
+    with pytest.raises(ValueError):
+        validate_fit_method('moments')
+    with pytest.raises(ValueError):
+        validate_fit_method(None)
+
+###############################################################################